@@ -1,25 +1,71 @@
 from datetime import datetime
 from zoneinfo import ZoneInfo
+import anthropic
 from langchain_anthropic import ChatAnthropic
 from src.tools import WebSearchTool, ArxivTool, WebScraperTool
 from src.tools.base_tool import ResearchTool
+from src.tools.item import ResearchItem
+from src.tools.render_modes import RenderModeStore
 from src.html_formatter import HTMLFormatter
+from src.llm_ledger import LLMCall, LLMLedger, bind_run, usage_from_response
+from src.response_stream import ResponseStreamParser
+from src.clustering import cluster_items, format_clusters
+from src.ranking import DEFAULT_N_FEATURES, rank_sources
+from src.result_store import ResultStore
+from src.tools.fetch_cache import FetchCache
+import hashlib
+import json
 import yaml
 import os
-from typing import List, Tuple, Dict, Any
+import time
+from typing import List, Tuple, Dict, Any, Callable
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
+
+def _is_retryable(exc: Exception) -> bool:
+    """Transient API failures worth retrying, matching the Anthropic SDK's own policy."""
+    if isinstance(exc, (anthropic.APIConnectionError, anthropic.RateLimitError)):
+        return True
+    if isinstance(exc, anthropic.APIStatusError):
+        return exc.status_code >= 500 or exc.status_code in (408, 409)
+    return False
+
 class ResearcherAgent:
-    def __init__(self, config_path: str = "config.yaml"):
+    def __init__(
+        self,
+        config_path: str = "config.yaml",
+        fetch_cache: FetchCache = None,
+        summary_cache: FetchCache = None,
+        render_modes: RenderModeStore = None,
+    ):
+        """
+        fetch_cache / summary_cache may be shared between agents (see batch
+        runs in src/pulse.py) so overlapping sources are fetched, parsed and
+        summarized only once. render_modes defaults to the process-wide store
+        for the configured path, so agents never race on the same file.
+        """
         self.config = ResearchTool.load_config(config_path)
+        self.fetch_cache = fetch_cache
+        self.summary_cache = summary_cache
+        self.render_modes = render_modes
         self.banner_map = self.config.get('banners', {})
         self.llm = ChatAnthropic(
             model=os.environ["FOUNDRY_DEPLOYMENT"],
             api_key=os.environ["FOUNDRY_API_KEY"],
             base_url=os.environ["FOUNDRY_ENDPOINT"],
+            # Retries are handled in _invoke_llm (transient errors only) so the ledger can count them.
+            max_retries=0,
         )
+        llm_conf = self.config.get("llm", {})
+        self.ledger = LLMLedger(llm_conf.get("pricing"), max_calls=llm_conf.get("ledger_max_calls", 5000))
         self._load_tools()
         self.html_formatter = HTMLFormatter()
+        scheduler_conf = self.config.get("scheduler", {})
+        self.result_store = (
+            ResultStore(scheduler_conf.get("store_dir", "output/cache"))
+            if scheduler_conf.get("enabled")
+            else None
+        )
 
     def _load_tools(self):
         tools_config = self.config['tools']
@@ -33,8 +79,38 @@ class ResearcherAgent:
                 for scraper_name, scraper_conf in conf.items():
                     scraper_conf['topics'] = scraper_conf.get('topics', [])
                     self.tool_instances[scraper_name] = WebScraperTool(scraper_name, scraper_conf)
+        if self.fetch_cache is not None:
+            for instance in self.tool_instances.values():
+                instance.fetch_cache = self.fetch_cache
+        if self.render_modes is None:
+            scraping_conf = self.config.get("scraping", {})
+            self.render_modes = RenderModeStore.shared(
+                scraping_conf.get("render_modes_path", "output/cache/render_modes.json"),
+                ttl_hours=scraping_conf.get("render_mode_ttl_hours", 24),
+            )
+        for instance in self.tool_instances.values():
+            if isinstance(instance, WebScraperTool):
+                instance.render_modes = self.render_modes
+        if self.config.get("ranking", {}).get("enabled"):
+            # Let ranking, not feed order, pick which items reach the LLM.
+            for instance in self.tool_instances.values():
+                instance.limit_results = False
     
-    def _invoke_llm(self, system_prompt, user_prompt: str) -> str:
+    def _invoke_llm(
+        self,
+        system_prompt,
+        user_prompt: str,
+        stage: str = "llm",
+        source: str = None,
+        on_text: Callable[[str], None] = None,
+    ) -> str:
+        """
+        Call the LLM with retries, recording tokens, latency and retries in the ledger.
+        With on_text the completion is streamed and on_text receives each new piece
+        of the <RESPONSE> body as it arrives; the full completion is still returned.
+        Only transient errors (connection, 429, 408/409, 5xx) are retried, and a
+        streamed call only if no text has been forwarded yet.
+        """
         messages = [
             (
                 "system", system_prompt
@@ -43,8 +119,51 @@ class ResearcherAgent:
                 "user", user_prompt
             )
         ]
-        response = self.llm.invoke(messages)
-        return response.content
+        llm_conf = self.config.get("llm", {})
+        max_retries = llm_conf.get("max_retries", 2)
+        backoff = llm_conf.get("retry_backoff_seconds", 2)
+        call = LLMCall(stage=stage, source=source, model=getattr(self.llm, "model", ""))
+        started = time.perf_counter()
+        attempt = 0
+        while True:
+            try:
+                if on_text is None:
+                    response = self.llm.invoke(messages)
+                else:
+                    response = self._stream_llm(messages, on_text, call, started)
+                break
+            except Exception as exc:
+                if attempt >= max_retries or call.first_token_s is not None or not _is_retryable(exc):
+                    call.ok = False
+                    call.error = f"{type(exc).__name__}: {exc}"
+                    call.retries = attempt
+                    call.latency_s = round(time.perf_counter() - started, 3)
+                    self.ledger.record(call)
+                    raise
+                time.sleep(backoff * (2 ** attempt))
+                attempt += 1
+        call.retries = attempt
+        call.latency_s = round(time.perf_counter() - started, 3)
+        call.model = (getattr(response, "response_metadata", None) or {}).get("model") or call.model
+        for key, value in usage_from_response(response).items():
+            setattr(call, key, value)
+        self.ledger.record(call)
+        return response.content if on_text is None else response.text
+
+    def _stream_llm(self, messages, on_text: Callable[[str], None], call: LLMCall, started: float):
+        """Stream a completion, forwarding <RESPONSE> text as it arrives; returns the merged message."""
+        parser = ResponseStreamParser()
+        response = None
+        for chunk in self.llm.stream(messages):
+            response = chunk if response is None else response + chunk
+            delta = parser.feed(chunk.text)
+            if delta:
+                if call.first_token_s is None:
+                    call.first_token_s = round(time.perf_counter() - started, 3)
+                on_text(delta)
+        if response is None:
+            raise RuntimeError("LLM stream ended without any output")
+        return response
 
     def _parse_output(self, output):
         """Parses the llm response, extracting json
@@ -60,7 +179,7 @@ class ResearcherAgent:
             print("RESPONSE tags not found in LLM output.")
             return None
     
-    def _generate_source_summary(self, source_output: str) -> str:
+    def _generate_source_summary(self, source_output: str, source: str = None) -> str:
         """Generate a concise summary from source output using LLM."""
         system_prompt = """
         You are an expert AI Engineer and Researcher. Summarize the following
@@ -75,26 +194,118 @@ class ResearcherAgent:
 
         {source_output}
         """
-        response = self._invoke_llm(system_prompt, user_prompt)
-        print("=== LLM Source Summary Response ===")
-        print(f"Type: {type(response)}, Content: {response}")
+        response = self._invoke_llm(system_prompt, user_prompt, stage="source_summary", source=source)
         summary = self._parse_output(response)
         return summary
 
-    def _generate_overview_summary(self, source_summaries: List[dict]) -> str:
+    def _reduce_summaries(self, partial_summaries: List[str], source: str = None) -> str:
+        """Merge chunk summaries of one source into a single bullet list using LLM."""
+        system_prompt = """
+        You are an expert AI Engineer and Researcher. You are given several partial
+        summaries of recent developments from the same source. Merge them into one
+        concise summary for a technical audience, removing duplicates and keeping
+        the key advancements and trends as a single bullet list.
+
+        Return the summary and bullets within the following XML tags:
+        <RESPONSE></RESPONSE>
+        """
+        joined = "\n\n".join(f"Partial summary {i + 1}:\n{text}" for i, text in enumerate(partial_summaries))
+        user_prompt = f"""
+        Please merge the following partial summaries:
+
+        {joined}
+        """
+        response = self._invoke_llm(system_prompt, user_prompt, stage="summary_reduce", source=source)
+        return self._parse_output(response)
+
+    @staticmethod
+    def _estimate_tokens(text: str) -> int:
+        """Rough token count (~4 characters per token) used for chunking decisions."""
+        return len(text or "") // 4 + 1
+
+    def _chunk_by_tokens(self, pieces: List[Any], sizes: List[int], max_tokens: int) -> List[List[Any]]:
+        """Greedily pack pieces into chunks of at most max_tokens (oversized pieces stand alone)."""
+        chunks, current, current_tokens = [], [], 0
+        for piece, size in zip(pieces, sizes):
+            if current and current_tokens + size > max_tokens:
+                chunks.append(current)
+                current, current_tokens = [], 0
+            current.append(piece)
+            current_tokens += size
+        if current:
+            chunks.append(current)
+        return chunks
+
+    def _summarize_source(self, name: str, items: List[ResearchItem], formatted_res: str) -> str:
+        """
+        Summarize a source in one call, or via map-reduce when its formatted
+        output exceeds summarization.map_reduce_threshold_tokens: items are split
+        into token-bounded chunks summarized in parallel, then the partial
+        summaries are merged level by level until one remains.
+        """
+        conf = self.config.get("summarization", {})
+        threshold = conf.get("map_reduce_threshold_tokens", 6000)
+        if (
+            not conf.get("map_reduce", True)
+            or len(items) < 2
+            or self._estimate_tokens(formatted_res) <= threshold
+        ):
+            return self._generate_source_summary(formatted_res, source=name)
+
+        chunk_tokens = conf.get("chunk_tokens", 3000)
+        max_workers = conf.get("max_workers", 4)
+        sizes = [self._estimate_tokens(ResearchTool.format_items(name, [item])) for item in items]
+        chunks = self._chunk_by_tokens(items, sizes, chunk_tokens)
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(chunks))) as executor:
+            partials = list(executor.map(
+                bind_run(lambda chunk: self._generate_source_summary(ResearchTool.format_items(name, chunk), source=name)),
+                chunks,
+            ))
+
+        partials = [p for p in partials if p]
+        while len(partials) > 1:
+            groups = self._chunk_by_tokens(partials, [self._estimate_tokens(p) for p in partials], chunk_tokens)
+            if len(groups) == len(partials):
+                # Every partial fills a chunk on its own; merge pairwise so the tree still shrinks.
+                groups = [partials[i:i + 2] for i in range(0, len(partials), 2)]
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(groups))) as executor:
+                merged = executor.map(
+                    bind_run(lambda group: group[0] if len(group) == 1 else self._reduce_summaries(group, source=name)),
+                    groups,
+                )
+                partials = [p for p in merged if p]
+        return partials[0] if partials else None
+
+    def _generate_overview_summary(
+        self,
+        source_summaries: List[dict],
+        clusters: List[dict] = None,
+        on_text: Callable[[str], None] = None,
+    ) -> str:
         """
         Create a one-liner bullet overview per source, tagging items under:
         - Tools & Technologies
         - Foundational Knowledge
         - Risks & governance
+        When clusters are given, the prompt carries one compact line per
+        cross-source story instead of every source summary, and the model is
+        asked for one line per story rather than per source.
+        With on_text the overview is streamed to it as it is generated.
         """
-        system_prompt = """
-        You are an AI research coordinator and keynote speaker sharing all the recent developments in AI research and technology.
-        Produce a three sentence overview sentence (Call it AI Research Roundup) and produce a concise markdown bullet list.
-        For each source, give ONE line that captures what to check out next, and note
+        if clusters:
+            line_instruction = """For each story, give ONE line that captures what to check out next, and note
+        which categories apply: Tools & Technologies, Foundational Knowledge, Risks & governance.
+        End each line with the story's source tags in parentheses
+        (e.g., "(arxiv)", "(google ai, openai)"). Stories are ordered by how many sources cover them."""
+        else:
+            line_instruction = """For each source, give ONE line that captures what to check out next, and note
         which categories apply: Tools & Technologies, Foundational Knowledge, Risks & governance.
         Include a short source tag for each line indicating where the update came from
-        (e.g., "(arxiv)", "(google ai)", "(medium)").
+        (e.g., "(arxiv)", "(google ai)", "(medium)")."""
+        system_prompt = f"""
+        You are an AI research coordinator and keynote speaker sharing all the recent developments in AI research and technology.
+        Produce a three sentence overview sentence (Call it AI Research Roundup) and produce a concise markdown bullet list.
+        {line_instruction}
         Keep it crisp and scannable.
 
         Here are the category details:
@@ -146,14 +357,21 @@ class ResearcherAgent:
         
         """
 
-        user_prompt = "Please create a concise overview of the following source summaries:\n\n"
-        lines = []
-        for src in source_summaries:
-            name = src.get("name", "source")
-            summary = src.get("summary", "")
-            lines.append(f"{name}: {summary}")
-        user_prompt = "\n\n".join(lines)
-        overview = self._invoke_llm(system_prompt, user_prompt)
+        if clusters:
+            user_prompt = (
+                "Please create a concise overview of the following stories. Each line is one story, "
+                "grouped across sources, with its source tags in brackets:\n\n"
+                + format_clusters(clusters)
+            )
+        else:
+            user_prompt = "Please create a concise overview of the following source summaries:\n\n"
+            lines = []
+            for src in source_summaries:
+                name = src.get("name", "source")
+                summary = src.get("summary", "")
+                lines.append(f"{name}: {summary}")
+            user_prompt = "\n\n".join(lines)
+        overview = self._invoke_llm(system_prompt, user_prompt, stage="overview", on_text=on_text)
         return overview
 
     def _source_url(self, name: str, instance) -> str:
@@ -174,67 +392,314 @@ class ResearcherAgent:
             return instance.config.get("description", "")
         return ""
 
-    def pulse_search(self, output_format: str = "markdown", return_data: bool = False) -> str | Tuple[str, Dict[str, Any]]:
-        """Aggregate latest from all tools."""
+    def _source_config(self, name: str) -> Dict[str, Any]:
+        """Return the config block for a source (top-level tool or webscraper)."""
+        tools_config = self.config.get("tools", {})
+        if name in tools_config:
+            return tools_config[name] or {}
+        return tools_config.get("webscrapers", {}).get(name, {}) or {}
+
+    def refresh_interval(self, name: str) -> float:
+        """Seconds between background refreshes of a source."""
+        default_minutes = self.config.get("scheduler", {}).get("default_refresh_minutes", 60)
+        return float(self._source_config(name).get("refresh_minutes", default_minutes)) * 60
+
+    def _source_fingerprint(self, name: str, days_back: int) -> str:
+        """Identify the config a stored result was produced with, so profiles sharing a store do not mix."""
+        payload = json.dumps(
+            [self._source_config(name), days_back, self.config.get("ranking", {})], sort_keys=True, default=str
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+
+    def _ranking_topics(self) -> List[str]:
+        """Topics to rank against: ranking.topics, else every configured tool topic."""
+        topics = self.config.get("ranking", {}).get("topics")
+        if topics:
+            return topics
+        seen = []
+        for instance in self.tool_instances.values():
+            for topic in instance.topics or []:
+                if topic not in seen:
+                    seen.append(topic)
+        return seen
+
+    def _rank_items(self, items_by_source: Dict[str, List[ResearchItem]], use_global: bool = True) -> Dict[str, List[ResearchItem]]:
+        """Score items locally and keep the configured top-k before they reach the LLM."""
+        ranking = self.config.get("ranking", {})
+        if not ranking.get("enabled"):
+            return items_by_source
+        # Tools return every matching item while ranking is on; their max_results
+        # is applied here, after scoring, together with per_source_top_k.
+        top_k = ranking.get("per_source_top_k")
+        limits = {}
+        for name in items_by_source:
+            caps = [k for k in (top_k, self.tool_instances[name].result_limit()) if k is not None]
+            limits[name] = min(caps) if caps else None
+        return rank_sources(
+            items_by_source,
+            self._ranking_topics(),
+            per_source_top_k=limits,
+            global_top_k=ranking.get("global_top_k") if use_global else None,
+            n_features=ranking.get("n_features", DEFAULT_N_FEATURES),
+        )
+
+    def process_source(self, name: str, days_back: int = None, items: List[ResearchItem] = None) -> Dict[str, Any]:
+        """
+        Fetch, format and summarize one source, updating the result store.
+        Pass already fetched and ranked items to skip the fetch step.
+        """
+        if days_back is None:
+            days_back = self.config.get('days_back', 1)
+        instance = self.tool_instances[name]
+        if items is None:
+            items = self._rank_items({name: instance.get_recent(days_back=days_back)}, use_global=False)[name]
+        res = items
+        formatted_res = instance.format_output(res)
+        if self.summary_cache is not None:
+            summary_key = ("summary", hashlib.sha256(formatted_res.encode("utf-8")).hexdigest())
+            summary = self.summary_cache.get_or_fetch(
+                summary_key, lambda: self._summarize_source(name, res, formatted_res)
+            )
+        else:
+            summary = self._summarize_source(name, res, formatted_res)
+        result = {
+            "name": name,
+            "description": self._source_description(name, instance),
+            "summary": summary,
+            "items": res,
+            "formatted_res": formatted_res,
+            "banner_url": self.banner_map.get(name),
+            "source_url": self._source_url(name, instance),
+            "fingerprint": self._source_fingerprint(name, days_back),
+        }
+        if self.result_store is not None:
+            self.result_store.put(name, result)
+        return result
+
+    def _fresh_result(self, name: str, days_back: int) -> Dict[str, Any] | None:
+        """Return a warm result from the scheduler when one is fresh enough."""
+        if self.result_store is None:
+            return None
+        max_age = self.refresh_interval(name) * self.config.get("scheduler", {}).get("max_age_factor", 2)
+        cached = self.result_store.get_fresh(name, max_age)
+        if cached is not None and cached.get("fingerprint") == self._source_fingerprint(name, days_back):
+            return cached
+        return None
+
+    def _cached_or_process(self, name: str, days_back: int) -> Dict[str, Any]:
+        cached = self._fresh_result(name, days_back)
+        if cached is not None:
+            return cached
+        return self.process_source(name, days_back)
+
+    def _map_sources(
+        self,
+        fn: Callable[[str], Any],
+        names: List[str],
+        on_result: Callable[[str, Any], None] = None,
+        errors: Dict[str, Exception] = None,
+    ) -> Dict[str, Any]:
+        """
+        Run fn for each source name in parallel, calling on_result in completion order.
+        A failing source does not stop the others: failures are collected into
+        errors when given, otherwise the first one is raised after every other
+        source has finished and been reported.
+        """
+        results = {}
+        if not names:
+            return results
+        failures = {} if errors is None else errors
+        max_workers = self.config.get("parallelism", {}).get("max_workers", 8)
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(names))) as executor:
+            future_map = {executor.submit(bind_run(fn), name): name for name in names}
+            for future in as_completed(future_map):
+                name = future_map[future]
+                try:
+                    results[name] = future.result()
+                except Exception as exc:
+                    print(f"Source {name} failed: {type(exc).__name__}: {exc}")
+                    failures[name] = exc
+                    continue
+                if on_result:
+                    on_result(name, results[name])
+        if errors is None and failures:
+            raise next(iter(failures.values()))
+        return results
+
+    def _resumed_result(self, name: str, entry: Dict[str, Any]) -> Dict[str, Any]:
+        """Rebuild a processed result from a checkpointed source entry."""
+        result = dict(entry)
+        result.setdefault("description", self._source_description(name, self.tool_instances[name]))
+        result.setdefault("banner_url", self.banner_map.get(name))
+        result.setdefault("source_url", self._source_url(name, self.tool_instances[name]))
+        result["formatted_res"] = self.tool_instances[name].format_output(result.get("items", []))
+        return result
+
+    def _cluster_sources(self, sources: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Group items across sources into stories when clustering is enabled."""
+        clustering = self.config.get("clustering", {})
+        if not clustering.get("enabled"):
+            return []
+        return cluster_items(
+            sources,
+            threshold=clustering.get("threshold", 0.35),
+            max_clusters=clustering.get("max_clusters"),
+            n_features=self.config.get("ranking", {}).get("n_features", DEFAULT_N_FEATURES),
+        )
+
+    def _record_llm_usage(self, run_id: str, generated_at: str, partial: bool = False) -> Dict[str, Any]:
+        """
+        Aggregate this run's LLM calls and append them to the rolling history file.
+        partial marks a run that failed before producing its report.
+        """
+        usage = self.ledger.summarize(run_id)
+        if partial:
+            usage["partial"] = True
+        llm_conf = self.config.get("llm", {})
+        history_path = llm_conf.get("history_path", "output/llm_history.jsonl")
+        if history_path:
+            self.ledger.append_history(
+                history_path,
+                {"generated_at": generated_at, "run_id": run_id, **usage, "calls": self.ledger.calls_as_dicts(run_id)},
+                max_records=llm_conf.get("history_max_runs", 200),
+            )
+        return usage
+
+    def _source_entry(self, result: Dict[str, Any]) -> Dict[str, Any]:
+        """Public per-source fields stored in reports."""
+        return {
+            "name": result["name"],
+            "description": result["description"],
+            "summary": result["summary"],
+            "items": result["items"],
+            "banner_url": result["banner_url"],
+            "source_url": result["source_url"],
+        }
+
+    def pulse_search(
+        self,
+        output_format: str = "markdown",
+        return_data: bool = False,
+        on_source: Callable[[Dict[str, Any]], None] = None,
+        completed: Dict[str, Dict[str, Any]] = None,
+        on_overview_text: Callable[[str], None] = None,
+        on_usage: Callable[[Dict[str, Any]], None] = None,
+    ) -> str | Tuple[str, Dict[str, Any]]:
+        """
+        Aggregate latest from all tools.
+        on_source is called with each source entry as soon as it completes,
+        e.g. to stream it into a report file. completed maps source names to
+        entries checkpointed by an earlier, interrupted run; those sources are
+        not fetched or summarized again.
+        If a source fails, the others still complete and are reported through
+        on_source before the error is raised, so a rerun only redoes the failures.
+        on_overview_text streams the overview text as the LLM produces it.
+        LLM usage in the returned data covers only this call's own LLM requests.
+        It is recorded even when the run fails (marked "partial"), and on_usage
+        is called with it either way.
+        """
+        with self.ledger.run() as run_id:
+            try:
+                return self._pulse_search(
+                    run_id, output_format, return_data, on_source, completed, on_overview_text, on_usage
+                )
+            except BaseException:
+                # The run failed, but its LLM calls were still paid for.
+                generated_at = datetime.now(ZoneInfo("America/Los_Angeles")).isoformat()
+                try:
+                    usage = self._record_llm_usage(run_id, generated_at, partial=True)
+                    if on_usage:
+                        on_usage(usage)
+                except Exception as exc:
+                    print(f"Could not record LLM usage: {exc}")
+                raise
+
+    def _pulse_search(
+        self,
+        run_id: str,
+        output_format: str,
+        return_data: bool,
+        on_source: Callable[[Dict[str, Any]], None],
+        completed: Dict[str, Dict[str, Any]],
+        on_overview_text: Callable[[str], None],
+        on_usage: Callable[[Dict[str, Any]], None],
+    ) -> str | Tuple[str, Dict[str, Any]]:
+        """Body of pulse_search, run inside its ledger scope."""
         days_back = self.config.get('days_back', 1)
         sections_md = []
         sources = []
 
         tool_items = list(self.tool_instances.items())
+        names = [name for name, _ in tool_items]
 
-        def _process_source(name: str, instance) -> Dict[str, Any]:
-            res = instance.get_recent(days_back=days_back)
-            formatted_res = instance.format_output(res)
-            summary = self._generate_source_summary(formatted_res)
-            return {
-                "name": name,
-                "description": self._source_description(name, instance),
-                "summary": summary,
-                "items": res,
-                "formatted_res": formatted_res,
-                "banner_url": self.banner_map.get(name),
-                "source_url": self._source_url(name, instance),
-            }
-
-        results_by_name = {}
-        parallelism = self.config.get("parallelism", {})
-        max_workers = parallelism.get("max_workers", 8)
-        with ThreadPoolExecutor(max_workers=min(max_workers, len(tool_items) or 1)) as executor:
-            future_map = {
-                executor.submit(_process_source, name, instance): name
-                for name, instance in tool_items
-            }
-            for future in as_completed(future_map):
-                name = future_map[future]
-                results_by_name[name] = future.result()
+        def _emit(name: str, result: Dict[str, Any]):
+            if on_source:
+                on_source(self._source_entry(result))
+
+        results_by_name = {
+            name: self._resumed_result(name, entry)
+            for name, entry in (completed or {}).items()
+            if name in self.tool_instances
+        }
+        names = [name for name in names if name not in results_by_name]
+        errors: Dict[str, Exception] = {}
+
+        ranking = self.config.get("ranking", {})
+        if ranking.get("enabled") and ranking.get("global_top_k"):
+            # Global top-k needs every source fetched before any is summarized.
+            for name in names:
+                cached = self._fresh_result(name, days_back)
+                if cached is not None:
+                    results_by_name[name] = cached
+                    _emit(name, cached)
+            pending = [name for name in names if name not in results_by_name]
+            fetched = self._map_sources(
+                lambda name: self.tool_instances[name].get_recent(days_back=days_back), pending, errors=errors
+            )
+            selected = self._rank_items(fetched)
+            results_by_name.update(self._map_sources(
+                lambda name: self.process_source(name, days_back, items=selected[name]),
+                list(selected),
+                _emit,
+                errors=errors,
+            ))
+        else:
+            results_by_name.update(self._map_sources(
+                lambda name: self._cached_or_process(name, days_back), names, _emit, errors=errors
+            ))
+
+        if errors:
+            print(f"{len(errors)} source(s) failed: {', '.join(errors)}")
+            raise next(iter(errors.values()))
 
         for name, _ in tool_items:
             result = results_by_name[name]
             sections_md.append(f"## {name}\n{result['summary']}\n\n{result['formatted_res']}")
-            sources.append({
-                "name": result["name"],
-                "description": result["description"],
-                "summary": result["summary"],
-                "items": result["items"],
-                "banner_url": result["banner_url"],
-                "source_url": result["source_url"],
-            })
+            sources.append(self._source_entry(result))
 
         combined_results = "\n\n".join(sections_md)
-        overall_summary = self._generate_overview_summary(sources)
+        clusters = self._cluster_sources(sources)
+        overall_summary = self._generate_overview_summary(sources, clusters, on_text=on_overview_text)
         combined_markdown = f"# Pulse Summary\n{overall_summary}\n\n{combined_results}"
 
+        generated_at = datetime.now(ZoneInfo("America/Los_Angeles")).isoformat()
+        llm_usage = self._record_llm_usage(run_id, generated_at)
+        if on_usage:
+            on_usage(llm_usage)
+
         report_data = {
-            "generated_at": datetime.now(ZoneInfo("America/Los_Angeles")).isoformat(),
+            "generated_at": generated_at,
             "overall_summary": overall_summary,
             "sources": sources,
             "sections_markdown": sections_md,
             "combined_markdown": combined_markdown,
             "days_back": days_back,
+            "clusters": clusters,
+            "llm_usage": llm_usage,
         }
 
         if output_format == "html":
-            html_content = self.html_formatter.format_pulse(overall_summary, sources)
+            html_content = self.html_formatter.format_pulse(overall_summary, sources, clusters)
             if return_data:
                 return html_content, report_data
             return html_content
@@ -253,7 +718,7 @@ class ResearcherAgent:
 
         results = []
         for instance in selected_tools:
-            res = instance.search(query)
+            res = instance.search(query)[:instance.result_limit()]
             results.append(instance.format_output(res))
 
         return "\n\n".join(results)
@@ -0,0 +1,79 @@
+"""
+Cross-source story clustering.
+
+Items from every source are embedded with the ranking vectorizer and grouped
+by leader clustering on cosine similarity: the strongest unassigned item opens
+a story and absorbs every unassigned item close enough to it. The overview
+prompt then gets one compact line per story instead of raw per-source text.
+"""
+from typing import Any, Dict, List
+
+import numpy as np
+
+from src.ranking import DEFAULT_N_FEATURES, item_text, vectorize
+from src.tools.item import ResearchItem
+
+
+def cluster_items(
+    sources: List[Dict[str, Any]],
+    threshold: float = 0.35,
+    max_clusters: int = None,
+    n_features: int = DEFAULT_N_FEATURES,
+) -> List[Dict[str, Any]]:
+    """
+    Group items across sources into stories.
+    Returns clusters ordered by how many sources cover them, each shaped as
+    {"title", "summary", "sources": [...], "items": [{"source", "title", "link"}]}.
+    """
+    flat = [
+        (src.get("name", "source"), ResearchItem.coerce(item, src.get("name", "source")))
+        for src in sources
+        for item in src.get("items", [])
+    ]
+    if not flat:
+        return []
+
+    vectors = vectorize([item_text(item) for _, item in flat], n_features)
+    sims = vectors @ vectors.T
+    scores = np.array([item.score or 0.0 for _, item in flat], dtype=np.float32)
+    # Leaders are taken by relevance score, then by how central the item is.
+    order = np.lexsort((-sims.sum(axis=1), -scores))
+
+    unassigned = np.ones(len(flat), dtype=bool)
+    clusters = []
+    for leader in order:
+        if not unassigned[leader]:
+            continue
+        members = np.flatnonzero(unassigned & (sims[leader] >= threshold))
+        unassigned[members] = False
+        leader_name, leader_item = flat[leader]
+        ordered = [leader] + [m for m in members if m != leader]
+        source_names = []
+        for m in ordered:
+            if flat[m][0] not in source_names:
+                source_names.append(flat[m][0])
+        clusters.append({
+            "title": leader_item.title,
+            "summary": leader_item.summary,
+            "sources": source_names,
+            "items": [
+                {"source": flat[m][0], "title": flat[m][1].title, "link": flat[m][1].link}
+                for m in ordered
+            ],
+        })
+
+    clusters.sort(key=lambda c: (len(c["sources"]), len(c["items"])), reverse=True)
+    return clusters[:max_clusters]
+
+
+def format_clusters(clusters: List[Dict[str, Any]], summary_chars: int = 160) -> str:
+    """One compact line per story with its source tags, for the overview prompt."""
+    lines = []
+    for cluster in clusters:
+        summary = cluster.get("summary", "") or ""
+        if len(summary) > summary_chars:
+            summary = summary[:summary_chars] + "..."
+        tags = ", ".join(cluster["sources"])
+        extra = f" (+{len(cluster['items']) - 1} related)" if len(cluster["items"]) > 1 else ""
+        lines.append(f"- {cluster['title']}{extra} [{tags}]: {summary}")
+    return "\n".join(lines)
@@ -4,6 +4,8 @@ from html import escape
 from typing import Dict, List, Any
 from markdown import markdown
 
+from src.tools.item import ResearchItem
+
 
 class HTMLFormatter:
     """Render research pulse results into an HTML page."""
@@ -36,15 +38,16 @@ class HTMLFormatter:
         return f"<div class=\"md\">{rendered}</div>"
 
 
-    def _render_posts(self, posts: List[Dict[str, Any]]) -> str:
+    def _render_posts(self, posts: List[ResearchItem | Dict[str, Any]]) -> str:
         if not posts:
             return "<p class=\"muted\">No new posts found.</p>"
         items = []
         for post in posts:
-            title = escape(post.get("title", "No title"))
-            link = escape(post.get("link", "#"), quote=True)
-            date = escape(post.get("date", "Unknown date"))
-            summary = escape(post.get("summary", ""))
+            post = ResearchItem.coerce(post)
+            title = escape(post.title)
+            link = escape(post.link, quote=True)
+            date = escape(post.date)
+            summary = escape(post.summary)
             items.append(
                 """
                 <li class=\"post\">
@@ -58,7 +61,31 @@ class HTMLFormatter:
             )
         return "<ul class=\"posts\">" + "".join(items) + "</ul>"
 
-    def format_pulse(self, overall_summary: str, sources: List[Dict[str, Any]]) -> str:
+    def _render_clusters(self, clusters: List[Dict[str, Any]]) -> str:
+        """Render cross-source stories with their source tags."""
+        items = []
+        for cluster in clusters:
+            lead = cluster.get("items", [{}])[0]
+            title = escape(cluster.get("title", "No title"))
+            link = escape(lead.get("link", "#"), quote=True)
+            tags = "".join(
+                f"<span class=\"story-tag\">{escape(name)}</span>" for name in cluster.get("sources", [])
+            )
+            related = "".join(
+                f"<li><a href=\"{escape(item.get('link', '#'), quote=True)}\" target=\"_blank\" rel=\"noopener\">"
+                f"{escape(item.get('title', 'No title'))}</a> <span class=\"muted\">({escape(item.get('source', ''))})</span></li>"
+                for item in cluster.get("items", [])[1:]
+            )
+            items.append(
+                "<li class=\"story\">"
+                f"<div class=\"post-header\"><a href=\"{link}\" target=\"_blank\" rel=\"noopener\">{title}</a>"
+                f"<span class=\"story-tags\">{tags}</span></div>"
+                + (f"<ul class=\"story-related\">{related}</ul>" if related else "")
+                + "</li>"
+            )
+        return "<ul class=\"posts stories\">" + "".join(items) + "</ul>"
+
+    def format_pulse(self, overall_summary: str, sources: List[Dict[str, Any]], clusters: List[Dict[str, Any]] = None) -> str:
         generated_at = datetime.now(ZoneInfo("America/Los_Angeles")).strftime("%Y-%m-%d %H:%M %Z")
         page = [
             "<!DOCTYPE html>",
@@ -103,6 +130,11 @@ class HTMLFormatter:
             ".post-summary{margin:6px 0 0 0;color:#35405c;}" \
             ".md ul{padding-left:20px;margin:6px 0;}" \
             ".md p{margin:6px 0;}" \
+            ".story{padding:10px 14px;border:1px solid #e8ecf5;border-radius:12px;margin:8px 0;background:#fff;}" \
+            ".story-tags{display:flex;gap:6px;flex-wrap:wrap;justify-content:flex-end;}" \
+            ".story-tag{font-size:11px;background:#e6eefc;color:#0f3c8a;border-radius:8px;padding:2px 6px;white-space:nowrap;}" \
+            ".story-related{margin:6px 0 0 0;padding-left:18px;font-size:13px;}" \
+            ".story-related a{color:#1b6ac9;text-decoration:none;}" \
             "</style>",
             "</head>",
             "<body>",
@@ -119,6 +151,14 @@ class HTMLFormatter:
             "</div>",
         ]
 
+        if clusters:
+            page.extend([
+                "<div class=\"section\">",
+                "<h2>Top Stories</h2>",
+                self._render_clusters(clusters),
+                "</div>",
+            ])
+
         for source in sources:
             name = source.get('name', 'Source')
             accent = self._accent_color(name)
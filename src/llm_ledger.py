@@ -0,0 +1,150 @@
+"""
+Structured ledger of LLM calls: tokens, latency, retries and cost per call,
+with per-run aggregates for report.jsonl and a rolling history file.
+
+Calls are tagged with the run that made them (see LLMLedger.run), so a run's
+usage excludes background scheduler refreshes and overlapping runs.
+"""
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass, field
+import json
+import threading
+import time
+import uuid
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+_current_run: ContextVar[Optional[str]] = ContextVar("llm_run_id", default=None)
+
+
+@dataclass
+class LLMCall:
+    stage: str
+    model: str
+    source: Optional[str] = None
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    cached_prompt_tokens: int = 0
+    latency_s: float = 0.0
+    # Seconds until the first response text arrived, for streamed calls.
+    first_token_s: Optional[float] = None
+    retries: int = 0
+    ok: bool = True
+    error: Optional[str] = None
+    run_id: Optional[str] = None
+    started_at: float = field(default_factory=time.time)
+
+
+def bind_run(fn: Callable) -> Callable:
+    """Wrap fn so calls it makes from worker threads count toward the caller's run."""
+    run_id = _current_run.get()
+
+    def _bound(*args, **kwargs):
+        token = _current_run.set(run_id)
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            _current_run.reset(token)
+    return _bound
+
+
+def usage_from_response(response) -> Dict[str, int]:
+    """Pull token counts out of a LangChain AIMessage(-chunk)."""
+    usage = getattr(response, "usage_metadata", None) or {}
+    details = usage.get("input_token_details") or {}
+    return {
+        "prompt_tokens": int(usage.get("input_tokens") or 0),
+        "completion_tokens": int(usage.get("output_tokens") or 0),
+        "cached_prompt_tokens": int(details.get("cache_read") or 0),
+    }
+
+
+class LLMLedger:
+    """Thread-safe record of every LLM call made by an agent."""
+
+    def __init__(self, pricing: Dict[str, float] = None, max_calls: int = 5000):
+        # USD per million tokens: input_per_mtok, output_per_mtok, cached_input_per_mtok.
+        self.pricing = pricing or {}
+        self._lock = threading.Lock()
+        # Bounded so a resident server (MCP + scheduler) does not grow without limit.
+        self._calls: deque[LLMCall] = deque(maxlen=max_calls)
+
+    @contextmanager
+    def run(self, run_id: str = None) -> Iterator[str]:
+        """Tag calls made in this context (and via bind_run) with a run id."""
+        run_id = run_id or uuid.uuid4().hex[:12]
+        token = _current_run.set(run_id)
+        try:
+            yield run_id
+        finally:
+            _current_run.reset(token)
+
+    def record(self, call: LLMCall):
+        if call.run_id is None:
+            call.run_id = _current_run.get()
+        with self._lock:
+            self._calls.append(call)
+
+    def calls(self, run_id: str = None) -> List[LLMCall]:
+        """Recorded calls, optionally only those of one run."""
+        with self._lock:
+            calls = list(self._calls)
+        if run_id is None:
+            return calls
+        return [c for c in calls if c.run_id == run_id]
+
+    def cost(self, call: LLMCall) -> Optional[float]:
+        if not self.pricing:
+            return None
+        uncached = max(call.prompt_tokens - call.cached_prompt_tokens, 0)
+        cached_price = self.pricing.get("cached_input_per_mtok", self.pricing.get("input_per_mtok", 0))
+        return (
+            uncached * self.pricing.get("input_per_mtok", 0)
+            + call.cached_prompt_tokens * cached_price
+            + call.completion_tokens * self.pricing.get("output_per_mtok", 0)
+        ) / 1_000_000
+
+    def _aggregate(self, calls: List[LLMCall]) -> Dict[str, Any]:
+        costs = [self.cost(c) for c in calls]
+        return {
+            "calls": len(calls),
+            "failed": sum(1 for c in calls if not c.ok),
+            "retries": sum(c.retries for c in calls),
+            "prompt_tokens": sum(c.prompt_tokens for c in calls),
+            "completion_tokens": sum(c.completion_tokens for c in calls),
+            "cached_prompt_tokens": sum(c.cached_prompt_tokens for c in calls),
+            "latency_s": round(sum(c.latency_s for c in calls), 3),
+            "max_latency_s": round(max((c.latency_s for c in calls), default=0.0), 3),
+            "cost_usd": round(sum(costs), 6) if self.pricing else None,
+        }
+
+    def summarize(self, run_id: str = None) -> Dict[str, Any]:
+        """Totals plus breakdowns by stage, source and model."""
+        calls = self.calls(run_id)
+        summary = {"total": self._aggregate(calls)}
+        for key in ("stage", "source", "model"):
+            groups: Dict[str, List[LLMCall]] = {}
+            for c in calls:
+                groups.setdefault(getattr(c, key) or "(none)", []).append(c)
+            summary[f"by_{key}"] = {name: self._aggregate(group) for name, group in groups.items()}
+        return summary
+
+    def calls_as_dicts(self, run_id: str = None) -> List[Dict[str, Any]]:
+        return [asdict(c) for c in self.calls(run_id)]
+
+    def append_history(self, path: str | Path, record: Dict[str, Any], max_records: int = None):
+        """Append one run's aggregates to a rolling JSON Lines history file, keeping the last max_records runs."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        line = json.dumps(record, separators=(",", ":"), default=str) + "\n"
+        with self._lock:
+            with open(path, "a", encoding="utf-8") as f:
+                f.write(line)
+            if max_records:
+                with open(path, "r", encoding="utf-8") as f:
+                    lines = f.readlines()
+                if len(lines) > max_records:
+                    with open(path, "w", encoding="utf-8") as f:
+                        f.writelines(lines[-max_records:])
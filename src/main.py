@@ -1,14 +1,59 @@
-from fastmcp import FastMCP
+import asyncio
+import sys
+import threading
+from datetime import datetime
+from pathlib import Path
+from zoneinfo import ZoneInfo
+
+from fastmcp import Context, FastMCP
 from src.agent import ResearcherAgent
+from src.profiling import profiled
+from src.scheduler import PulseScheduler
 
 app = FastMCP("researcher-agent")
 
 agent = ResearcherAgent()
+if agent.config.get("scheduler", {}).get("run_in_server"):
+    # Keep source summaries warm in this process instead of a separate `make daemon`.
+    PulseScheduler(agent).start()
+
+# Profiles sample the whole process, so profiled pulse calls run one at a time.
+_profile_lock = threading.Lock()
+
+def _run_pulse(on_overview_text=None) -> str:
+    profiling = agent.config.get("profiling", {})
+    if not profiling.get("enabled"):
+        return agent.pulse_search(on_overview_text=on_overview_text)
+    with _profile_lock:
+        stamp = datetime.now(ZoneInfo("America/Los_Angeles")).strftime("profile_%Y%m%d_%H%M%S_%f")
+        with profiled(Path(profiling.get("output_dir", "output/profiles")) / stamp, profiling):
+            return agent.pulse_search(on_overview_text=on_overview_text)
 
 @app.tool()
-async def pulse_research() -> str:
+async def pulse_research(ctx: Context) -> str:
     """Get the latest pulse of developments from all sources."""
-    return agent.pulse_search()
+    # The pulse runs in a worker thread; the overview is streamed back to the
+    # caller as progress notifications while the LLM generates it. Each message
+    # carries the whole overview so far, since clients show only the latest one.
+    loop = asyncio.get_running_loop()
+    overview = ""
+    pending = []
+
+    def _forward(delta: str):
+        nonlocal overview
+        overview += delta
+        pending.append(asyncio.run_coroutine_threadsafe(
+            ctx.report_progress(progress=len(overview), message=overview), loop
+        ))
+
+    try:
+        return await asyncio.to_thread(_run_pulse, _forward)
+    finally:
+        for future in pending:
+            try:
+                await asyncio.wrap_future(future)
+            except Exception as exc:
+                print(f"pulse_research: progress notification failed: {exc}", file=sys.stderr)
 
 @app.tool()
 async def targeted_research(query: str, tools: str = None) -> str:
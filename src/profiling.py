@@ -0,0 +1,251 @@
+"""
+Low-overhead profiling of pulse runs.
+
+A background thread samples the stack of every other thread at a fixed
+interval (``sys._current_frames``), so time spent in worker threads is seen
+too. Samples are written as folded stacks (``profile.folded``), the input
+format of flamegraph.pl, speedscope and inferno. Each sample is also
+attributed to the innermost library on its stack, which gives a
+parsing-versus-network breakdown (``profile_summary.txt``). tracemalloc
+snapshots taken at start and stop give a top-allocation report
+(``allocations.txt``).
+"""
+from collections import Counter
+from contextlib import contextmanager
+import sys
+import threading
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional
+
+# Top-level module -> bucket for the per-library breakdown.
+LIBRARY_BUCKETS = {
+    "bs4": "BeautifulSoup",
+    "soupsieve": "BeautifulSoup",
+    "html": "BeautifulSoup",
+    "feedparser": "feedparser",
+    "sgmllib": "feedparser",
+    "dateutil": "dateutil",
+    "markdown": "markdown",
+    "playwright": "playwright",
+    "numpy": "numpy",
+    "json": "json",
+    "gzip": "compression",
+    "zlib": "compression",
+    "zstandard": "compression",
+    "socket": "network",
+    "ssl": "network",
+    "selectors": "network",
+    "http": "network",
+    "urllib": "network",
+    "urllib3": "network",
+    "requests": "network",
+    "httpx": "network",
+    "httpcore": "network",
+    "anyio": "network",
+    "threading": "waiting",
+    "queue": "waiting",
+    "concurrent": "waiting",
+}
+
+
+# Threads whose names start with these are not sampled (the background
+# scheduler refreshes sources on its own cadence, unrelated to the run).
+EXCLUDED_THREAD_PREFIXES = ("pulse-scheduler",)
+
+# tracemalloc is process-global: overlapping profilers share it, and only the
+# last one to finish stops it (and only if a profiler started it).
+_tracemalloc_lock = threading.Lock()
+_tracemalloc_users = 0
+_tracemalloc_owned = False
+
+
+def _acquire_tracemalloc(frames: int):
+    global _tracemalloc_users, _tracemalloc_owned
+    with _tracemalloc_lock:
+        if _tracemalloc_users == 0 and not tracemalloc.is_tracing():
+            tracemalloc.start(frames)
+            _tracemalloc_owned = True
+        _tracemalloc_users += 1
+
+
+def _release_tracemalloc():
+    global _tracemalloc_users, _tracemalloc_owned
+    with _tracemalloc_lock:
+        _tracemalloc_users -= 1
+        if _tracemalloc_users == 0 and _tracemalloc_owned:
+            tracemalloc.stop()
+            _tracemalloc_owned = False
+
+
+def frame_label(frame) -> str:
+    """Folded-stack label for a frame: ``module:qualified.function``."""
+    code = frame.f_code
+    module = frame.f_globals.get("__name__", "?")
+    name = getattr(code, "co_qualname", code.co_name)
+    return f"{module}:{name}".replace(";", ":").replace(" ", "_")
+
+
+def library_bucket(modules: List[str]) -> str:
+    """Bucket for a stack given innermost-first module names; "other" if none is known."""
+    for module in modules:
+        bucket = LIBRARY_BUCKETS.get(module.split(".", 1)[0])
+        if bucket:
+            return bucket
+    return "other"
+
+
+class SamplingProfiler:
+    """Sample every thread's stack and track allocations between start() and stop()."""
+
+    def __init__(self, interval_seconds: float = 0.01, trace_allocations: bool = True, tracemalloc_frames: int = 10):
+        self.interval_seconds = interval_seconds
+        self.trace_allocations = trace_allocations
+        self.tracemalloc_frames = tracemalloc_frames
+        self.stacks: Counter = Counter()
+        self.buckets: Counter = Counter()
+        self.samples = 0
+        self.duration_s = 0.0
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._tracing = False
+        self._snapshot_start = None
+        self._snapshot_end = None
+        self._started_at = 0.0
+
+    def start(self):
+        if self.trace_allocations:
+            _acquire_tracemalloc(self.tracemalloc_frames)
+            self._tracing = True
+            self._snapshot_start = tracemalloc.take_snapshot()
+        self._started_at = time.perf_counter()
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="pulse-profiler", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
+        self.duration_s = time.perf_counter() - self._started_at
+        if self._tracing:
+            try:
+                self._snapshot_end = tracemalloc.take_snapshot()
+            finally:
+                self._tracing = False
+                _release_tracemalloc()
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+
+    def _run(self):
+        own_id = threading.get_ident()
+        while not self._stop.wait(self.interval_seconds):
+            names = {t.ident: t.name for t in threading.enumerate()}
+            for thread_id, frame in sys._current_frames().items():
+                name = names.get(thread_id, f"thread-{thread_id}")
+                if thread_id == own_id or name.startswith(EXCLUDED_THREAD_PREFIXES):
+                    continue
+                self._sample(name, frame)
+            self.samples += 1
+
+    def _sample(self, thread_name: str, frame):
+        labels, modules = [], []
+        while frame is not None:
+            labels.append(frame_label(frame))
+            modules.append(frame.f_globals.get("__name__", ""))
+            frame = frame.f_back
+        labels.append(thread_name.replace(";", ":").replace(" ", "_"))
+        self.stacks[";".join(reversed(labels))] += 1
+        self.buckets[library_bucket(modules)] += 1
+
+    def folded(self) -> Iterator[str]:
+        """Folded stack lines, ``root;...;leaf count``, most frequent first."""
+        for stack, count in self.stacks.most_common():
+            yield f"{stack} {count}"
+
+    def summary(self) -> str:
+        total = sum(self.buckets.values()) or 1
+        lines = [
+            f"Sampled {self.samples} times over {self.duration_s:.2f}s "
+            f"({self.interval_seconds * 1000:.0f} ms interval), {sum(self.buckets.values())} thread samples.",
+            "Thread samples by innermost library (\"waiting\" is idle on locks/futures):",
+        ]
+        for bucket, count in self.buckets.most_common():
+            lines.append(f"  {bucket:<14} {count:>7}  {100 * count / total:5.1f}%")
+        return "\n".join(lines)
+
+    def allocation_report(self, limit: int = 25) -> str:
+        if self._snapshot_end is None:
+            return "Allocation tracing was disabled."
+        filters = [
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+            tracemalloc.Filter(False, "<unknown>"),
+        ]
+        end = self._snapshot_end.filter_traces(filters)
+        lines = [f"Top {limit} allocation sites by net growth during the run:"]
+        if self._snapshot_start is not None:
+            start = self._snapshot_start.filter_traces(filters)
+            for stat in end.compare_to(start, "lineno")[:limit]:
+                lines.append(f"  {stat}")
+        lines.append("")
+        lines.append(f"Top {limit} allocation sites still live at the end of the run:")
+        for stat in end.statistics("lineno")[:limit]:
+            lines.append(f"  {stat}")
+        lines.append("")
+        lines.append(f"Top {min(limit, 10)} live allocation tracebacks:")
+        for stat in end.statistics("traceback")[:min(limit, 10)]:
+            lines.append(f"  {stat.count} blocks, {stat.size / 1024:.1f} KiB")
+            lines.extend(f"    {line}" for line in stat.traceback.format(limit=self.tracemalloc_frames))
+        return "\n".join(lines)
+
+    def write(self, output_dir: str | Path, top_allocations: int = 25) -> Dict[str, Path]:
+        """Write profile.folded, profile_summary.txt and allocations.txt into output_dir."""
+        output_dir = Path(output_dir)
+        output_dir.mkdir(parents=True, exist_ok=True)
+        paths = {
+            "folded": output_dir / "profile.folded",
+            "summary": output_dir / "profile_summary.txt",
+            "allocations": output_dir / "allocations.txt",
+        }
+        paths["folded"].write_text("\n".join(self.folded()) + "\n", encoding="utf-8")
+        paths["summary"].write_text(self.summary() + "\n", encoding="utf-8")
+        paths["allocations"].write_text(self.allocation_report(top_allocations) + "\n", encoding="utf-8")
+        return paths
+
+
+@contextmanager
+def profiled(output_dir: str | Path, config: Dict = None) -> Iterator[SamplingProfiler]:
+    """
+    Profile the enclosed block and write its reports to output_dir, even if
+    the block raises. config takes the `profiling` section keys interval_ms,
+    trace_allocations and top_allocations. Profiles sample every thread, so
+    callers that may overlap should serialize profiled blocks (see src/main.py).
+    """
+    config = config or {}
+    profiler = SamplingProfiler(
+        interval_seconds=config.get("interval_ms", 10) / 1000,
+        trace_allocations=config.get("trace_allocations", True),
+    )
+    profiler.start()
+    try:
+        yield profiler
+    finally:
+        # Profiling problems are reported, never raised over the block's own result or error.
+        try:
+            profiler.stop()
+            paths = profiler.write(output_dir, config.get("top_allocations", 25))
+        except Exception as exc:
+            print(f"Profiling failed: {type(exc).__name__}: {exc}", file=sys.stderr)
+        else:
+            print(f"Profile written to {paths['folded']} ({profiler.samples} samples); "
+                  f"allocations in {paths['allocations'].name}", file=sys.stderr)
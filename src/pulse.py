@@ -3,14 +3,28 @@
 Generate research pulse reports (HTML, Markdown, JSON) or regenerate from saved JSON.
 """
 import argparse
-import json
 import shutil
+from contextlib import nullcontext
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from zoneinfo import ZoneInfo
 from pathlib import Path
+from typing import Dict, List
 
 from src.agent import ResearcherAgent
 from src.html_formatter import HTMLFormatter
+from src.profiling import profiled
+from src.report_store import (
+    COMPRESSION_SUFFIXES,
+    ReportReader,
+    ReportWriter,
+    compression_for,
+    find_report,
+    load_report,
+    render_markdown,
+    report_filename,
+)
+from src.tools.fetch_cache import FetchCache
 
 
 OUTPUT_ROOT = Path("output")
@@ -31,56 +45,205 @@ def _ensure_assets(dest_dir: Path):
     shutil.copytree(src_assets, dest_assets)
 
 
-def _resolve_json_path(arg: str) -> Path:
+def _resolve_report_path(arg: str) -> Path:
     candidate = Path(arg)
-    if candidate.is_dir():
-        return candidate / "report.json"
-    if candidate.suffix.lower() == ".json":
+    if not candidate.is_dir() and candidate.suffix.lower() in (".json", ".jsonl", ".gz", ".zst"):
         return candidate
-    return OUTPUT_ROOT / arg / "report.json"
+    directory = candidate if candidate.is_dir() else OUTPUT_ROOT / arg
+    return find_report(directory) or directory / "report.json"
 
 
-def write_report_from_live():
-    agent = ResearcherAgent()
-    markdown_content, data = agent.pulse_search(output_format="markdown", return_data=True)
-    html_content = agent.html_formatter.format_pulse(data["overall_summary"], data["sources"])
-
-    output_dir = OUTPUT_ROOT / _timestamp_slug()
+def _generate_live_report(
+    agent: ResearcherAgent,
+    output_dir: Path,
+    compression: str = "none",
+    completed: List[Dict] = None,
+    generated_at: str = None,
+    profile: bool = False,
+) -> Dict[str, Path]:
+    """
+    Run a pulse for one agent and write its Markdown, HTML and report files.
+    Each source is checkpointed to the report as it completes. When resuming,
+    completed holds the sources already checkpointed in the existing report;
+    they are not rerun, and new records are appended after them.
+    With profile, the run is sampled and the profile is written alongside.
+    The overview is streamed into pulse_report.md as it is generated; the file
+    is replaced by the full report once the run completes.
+    """
     output_dir.mkdir(parents=True, exist_ok=True)
     _ensure_assets(output_dir)
 
     md_path = output_dir / "pulse_report.md"
     html_path = output_dir / "pulse_report.html"
-    json_path = output_dir / "report.json"
+    report_path = output_dir / report_filename(compression)
+
+    resuming = completed is not None
+    completed = completed or []
+    generated_at = generated_at or datetime.now(ZoneInfo("America/Los_Angeles")).isoformat()
+    overview_fh = None
+
+    def _write_overview_text(delta: str):
+        nonlocal overview_fh
+        if overview_fh is None:
+            overview_fh = open(md_path, "w", encoding="utf-8")
+            overview_fh.write("# Pulse Summary\n")
+        overview_fh.write(delta)
+        overview_fh.flush()
+
+    def _write_partial_usage(usage: Dict):
+        # A completed run's usage is written after its overview below.
+        if usage.get("partial"):
+            writer.write_usage(usage)
+
+    with profiled(output_dir, agent.config.get("profiling")) if profile else nullcontext():
+        with ReportWriter(
+            report_path, generated_at=generated_at, days_back=agent.config.get("days_back", 1), append=resuming
+        ) as writer:
+            try:
+                markdown_content, data = agent.pulse_search(
+                    output_format="markdown",
+                    return_data=True,
+                    on_source=writer.write_source,
+                    completed={source["name"]: source for source in completed},
+                    on_overview_text=_write_overview_text,
+                    on_usage=_write_partial_usage,
+                )
+            finally:
+                if overview_fh is not None:
+                    overview_fh.close()
+            writer.write_overview(
+                data["overall_summary"], [src["name"] for src in data["sources"]], data.get("clusters")
+            )
+            writer.write_usage(data["llm_usage"])
+        html_content = agent.html_formatter.format_pulse(data["overall_summary"], data["sources"], data.get("clusters"))
 
     md_path.write_text(markdown_content, encoding="utf-8")
     html_path.write_text(html_content, encoding="utf-8")
-    json_path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+    return {"markdown": md_path, "html": html_path, "report": report_path}
 
+
+def _print_live_paths(agent: ResearcherAgent, output_dir: Path, paths: Dict[str, Path]):
     print(f"Reports generated in: {output_dir}")
-    print(f"- Markdown: {md_path}")
-    print(f"- HTML:     {html_path}")
-    print(f"- JSON:     {json_path}")
+    print(f"- Markdown: {paths['markdown']}")
+    print(f"- HTML:     {paths['html']}")
+    print(f"- Report:   {paths['report']}")
+    totals = agent.ledger.summarize()["total"]
+    print(f"- LLM:      {totals['calls']} calls, {totals['prompt_tokens']} prompt / "
+          f"{totals['completion_tokens']} completion tokens, {totals['latency_s']}s total latency")
+
+
+def write_report_from_live(compression: str = "none", profile: bool = False):
+    agent = ResearcherAgent()
+    output_dir = OUTPUT_ROOT / _timestamp_slug()
+    try:
+        paths = _generate_live_report(agent, output_dir, compression, profile=profile)
+    except BaseException:
+        print(f"Pulse run failed; completed sources are saved in {output_dir}.")
+        print(f"Resume with: python -m src.pulse --resume {output_dir.name}")
+        raise
+    _print_live_paths(agent, output_dir, paths)
+
+
+def resume_report(dir_arg: str, profile: bool = False):
+    """
+    Finish an interrupted run in place: sources already checkpointed in its
+    report are reused, and only the missing sources and the overview are run.
+    """
+    report_path = _resolve_report_path(dir_arg)
+    if not report_path.exists():
+        raise FileNotFoundError(f"Could not find report at {report_path}")
+    if report_path.suffix.lower() == ".json":
+        raise ValueError(f"{report_path} is a legacy report without per-source checkpoints; it cannot be resumed")
+
+    reader = ReportReader(report_path)
+    if reader.overview() is not None:
+        print(f"{report_path} is already complete; regenerating outputs.")
+        write_report_from_json(str(report_path))
+        return
+
+    completed = list(reader.sources())
+    output_dir = report_path.parent
+    compression = compression_for(report_path)
+    agent = ResearcherAgent()
+    print(f"Resuming {output_dir}: {len(completed)} source(s) already done "
+          f"({', '.join(s['name'] for s in completed) or 'none'}).")
+    try:
+        paths = _generate_live_report(
+            agent, output_dir, compression, completed=completed, generated_at=reader.header().get("generated_at"),
+            profile=profile,
+        )
+    except BaseException:
+        print(f"Pulse run failed again; resume with: python -m src.pulse --resume {output_dir.name}")
+        raise
+    _print_live_paths(agent, output_dir, paths)
+
+
+def _profile_names(config_paths: List[str]) -> List[str]:
+    """Name each profile after its config file, de-duplicating clashes."""
+    names = []
+    for path in config_paths:
+        base = Path(path).stem
+        name, n = base, 2
+        while name in names:
+            name = f"{base}_{n}"
+            n += 1
+        names.append(name)
+    return names
+
+
+def write_batch_from_live(config_paths: List[str], compression: str = "none", profile: bool = False):
+    """
+    Run several config profiles in one process. Agents share a fetch cache and a
+    summary cache, so each unique source is fetched and parsed once and each
+    distinct filtered source is summarized once, however many profiles use it.
+    With profile, the whole batch is sampled into one profile in the batch folder.
+    """
+    fetch_cache = FetchCache()
+    summary_cache = FetchCache()
+    agents = {
+        name: ResearcherAgent(path, fetch_cache=fetch_cache, summary_cache=summary_cache)
+        for name, path in zip(_profile_names(config_paths), config_paths)
+    }
+    batch_dir = OUTPUT_ROOT / _timestamp_slug().replace("generated_at_", "batch_at_")
+
+    profiling = next(iter(agents.values())).config.get("profiling") if agents else None
+    with profiled(batch_dir, profiling) if profile else nullcontext():
+        with ThreadPoolExecutor(max_workers=len(agents) or 1) as executor:
+            futures = {
+                name: executor.submit(_generate_live_report, agent, batch_dir / name, compression)
+                for name, agent in agents.items()
+            }
+            paths_by_profile = {name: future.result() for name, future in futures.items()}
+
+    print(f"Batch reports generated in: {batch_dir}")
+    print(f"- Profiles: {len(agents)}, unique fetches: {fetch_cache.misses} (reused {fetch_cache.hits}), "
+          f"summaries: {summary_cache.misses} (reused {summary_cache.hits})")
+    for name, paths in paths_by_profile.items():
+        print(f"- {name}: {paths['html']}")
 
 
 def write_report_from_json(json_arg: str):
-    json_path = _resolve_json_path(json_arg)
-    if not json_path.exists():
-        raise FileNotFoundError(f"Could not find JSON at {json_path}")
+    report_path = _resolve_report_path(json_arg)
+    if not report_path.exists():
+        raise FileNotFoundError(f"Could not find report at {report_path}")
 
-    with open(json_path, "r", encoding="utf-8") as f:
-        data = json.load(f)
+    data = load_report(report_path)
 
-    output_dir = json_path.parent
+    output_dir = report_path.parent
     _ensure_assets(output_dir)
 
     combined_markdown = data.get("combined_markdown")
     if not combined_markdown:
-        sections = data.get("sections_markdown", [])
-        combined_markdown = f"# Pulse Summary\n{data.get('overall_summary','')}\n\n" + "\n\n".join(sections)
+        sections = data.get("sections_markdown")
+        if sections:
+            combined_markdown = f"# Pulse Summary\n{data.get('overall_summary','')}\n\n" + "\n\n".join(sections)
+        else:
+            combined_markdown = render_markdown(data.get("overall_summary", ""), data.get("sources", []))
 
     formatter = HTMLFormatter()
-    html_content = formatter.format_pulse(data.get("overall_summary", ""), data.get("sources", []))
+    html_content = formatter.format_pulse(
+        data.get("overall_summary", ""), data.get("sources", []), data.get("clusters")
+    )
 
     md_path = output_dir / "pulse_report.md"
     html_path = output_dir / "pulse_report.html"
@@ -95,13 +258,21 @@ def write_report_from_json(json_arg: str):
 
 def main():
     parser = argparse.ArgumentParser(description="Generate or regenerate research pulse reports.")
-    parser.add_argument("--from-json", dest="from_json", help="Path or subfolder to report.json to regenerate outputs")
+    parser.add_argument("--from-json", dest="from_json", help="Path or subfolder of a saved report (report.jsonl[.gz|.zst] or legacy report.json) to regenerate outputs")
+    parser.add_argument("--compression", choices=list(COMPRESSION_SUFFIXES), default="none", help="Compression for the saved report")
+    parser.add_argument("--resume", metavar="SUBDIR", help="Finish an interrupted run, rerunning only the sources missing from its report")
+    parser.add_argument("--profile", action="store_true", help="Sample all threads and trace allocations; writes profile.folded, profile_summary.txt and allocations.txt into the output folder")
+    parser.add_argument("--batch", nargs="+", metavar="CONFIG", help="Run several config profiles sharing one fetch and summary layer")
     args = parser.parse_args()
 
     if args.from_json:
         write_report_from_json(args.from_json)
+    elif args.resume:
+        resume_report(args.resume, profile=args.profile)
+    elif args.batch:
+        write_batch_from_live(args.batch, compression=args.compression, profile=args.profile)
     else:
-        write_report_from_live()
+        write_report_from_live(compression=args.compression, profile=args.profile)
 
 
 if __name__ == "__main__":
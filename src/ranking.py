@@ -0,0 +1,105 @@
+"""
+Local relevance ranking of fetched items against the configured topics.
+
+Items are embedded with a hashing vectorizer (unigrams + bigrams, TF-IDF
+weighted, L2-normalized) in one NumPy batch and scored by cosine similarity to
+the closest topic. No network or GPU is involved.
+"""
+import re
+import zlib
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+
+from src.tools.item import ResearchItem
+
+
+TOKEN_RE = re.compile(r"[a-z0-9]+(?:[-'][a-z0-9]+)*")
+DEFAULT_N_FEATURES = 2 ** 14
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase word tokens plus adjacent-word bigrams."""
+    words = TOKEN_RE.findall((text or "").lower())
+    return words + [f"{a} {b}" for a, b in zip(words, words[1:])]
+
+
+def hashing_vectorize(texts: List[str], n_features: int = DEFAULT_N_FEATURES) -> np.ndarray:
+    """Term-count matrix of shape (len(texts), n_features) via the hashing trick."""
+    rows, cols = [], []
+    for row, text in enumerate(texts):
+        for token in tokenize(text):
+            rows.append(row)
+            cols.append(zlib.crc32(token.encode("utf-8")) % n_features)
+    matrix = np.zeros((len(texts), n_features), dtype=np.float32)
+    if rows:
+        np.add.at(matrix, (np.asarray(rows), np.asarray(cols)), 1.0)
+    return matrix
+
+
+def tfidf_normalize(counts: np.ndarray) -> np.ndarray:
+    """Apply sublinear TF, smoothed IDF and L2 row normalization."""
+    if counts.size == 0:
+        return counts
+    n_docs = counts.shape[0]
+    df = np.count_nonzero(counts, axis=0)
+    idf = np.log((1.0 + n_docs) / (1.0 + df)) + 1.0
+    weighted = np.log1p(counts) * idf.astype(np.float32)
+    norms = np.linalg.norm(weighted, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return weighted / norms
+
+
+def vectorize(texts: List[str], n_features: int = DEFAULT_N_FEATURES) -> np.ndarray:
+    """TF-IDF weighted, L2-normalized hashing vectors for a batch of texts."""
+    return tfidf_normalize(hashing_vectorize(texts, n_features))
+
+
+def item_text(item: ResearchItem) -> str:
+    """Text used to represent an item; the title is counted twice."""
+    return f"{item.title} {item.title} {item.summary}"
+
+
+def score_items(items: List[ResearchItem], topics: Iterable[str], n_features: int = DEFAULT_N_FEATURES) -> np.ndarray:
+    """Cosine similarity of each item to its closest topic."""
+    topics = [t for t in topics if t]
+    if not items or not topics:
+        return np.zeros(len(items), dtype=np.float32)
+    # Fit IDF over items and topics together so topic terms are weighted consistently.
+    vectors = vectorize([item_text(item) for item in items] + topics, n_features)
+    item_vecs, topic_vecs = vectors[:len(items)], vectors[len(items):]
+    return (item_vecs @ topic_vecs.T).max(axis=1)
+
+
+def rank_sources(
+    items_by_source: Dict[str, List[ResearchItem]],
+    topics: Iterable[str],
+    per_source_top_k: Optional[int] | Dict[str, Optional[int]] = None,
+    global_top_k: Optional[int] = None,
+    n_features: int = DEFAULT_N_FEATURES,
+) -> Dict[str, List[ResearchItem]]:
+    """
+    Score every item in one batch, set item.score, and keep the top-k per
+    source and then globally. per_source_top_k may be a dict of per-source
+    limits. Each source's kept items are ordered by score.
+    """
+    flat = [(name, item) for name, items in items_by_source.items() for item in items]
+    scores = score_items([item for _, item in flat], topics, n_features)
+    for (_, item), score in zip(flat, scores):
+        item.score = round(float(score), 4)
+
+    if not isinstance(per_source_top_k, dict):
+        per_source_top_k = {name: per_source_top_k for name in items_by_source}
+    ranked = {
+        name: sorted(items, key=lambda item: item.score, reverse=True)[:per_source_top_k.get(name)]
+        for name, items in items_by_source.items()
+    }
+    if global_top_k is not None:
+        kept = sorted(
+            (item for items in ranked.values() for item in items),
+            key=lambda item: item.score,
+            reverse=True,
+        )[:global_top_k]
+        kept_ids = {id(item) for item in kept}
+        ranked = {name: [item for item in items if id(item) in kept_ids] for name, items in ranked.items()}
+    return ranked
@@ -0,0 +1,289 @@
+"""
+Compact, streamable storage for pulse reports.
+
+A report is a JSON Lines file (optionally gzip or zstd compressed) with one
+record per line:
+
+    {"type":"header","format":"pulse-report","version":2,"generated_at":...,"days_back":...}
+    {"type":"source","name":...,"description":...,"summary":...,"items":[...],...}
+    {"type":"overview","overall_summary":...,"sources":[<names in display order>],"clusters":[...]}
+    {"type":"usage","llm_usage":{...}}
+
+Source records are appended as sources complete, so a partially written report
+is still readable. Markdown sections are not stored; they are rebuilt from the
+summaries and items when needed.
+"""
+import gzip
+import io
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+from src.tools.base_tool import ResearchTool
+from src.tools.item import ResearchItem
+
+
+REPORT_FORMAT = "pulse-report"
+REPORT_FORMAT_VERSION = 2
+REPORT_BASENAME = "report.jsonl"
+COMPRESSION_SUFFIXES = {"none": "", "gzip": ".gz", "zstd": ".zst"}
+SOURCE_FIELDS = ("name", "description", "summary", "items", "banner_url", "source_url")
+
+
+def report_filename(compression: str = "none") -> str:
+    """Return the report file name for a compression mode."""
+    if compression not in COMPRESSION_SUFFIXES:
+        raise ValueError(f"Unsupported compression '{compression}'. Use one of: {', '.join(COMPRESSION_SUFFIXES)}")
+    return REPORT_BASENAME + COMPRESSION_SUFFIXES[compression]
+
+
+def find_report(directory: Path) -> Optional[Path]:
+    """Locate the report file in a run directory, preferring the compact format."""
+    candidates = [report_filename(c) for c in COMPRESSION_SUFFIXES] + ["report.json"]
+    for name in candidates:
+        path = Path(directory) / name
+        if path.exists():
+            return path
+    return None
+
+
+def compression_for(path: Path) -> str:
+    suffix = Path(path).suffix.lower()
+    if suffix == ".gz":
+        return "gzip"
+    if suffix == ".zst":
+        return "zstd"
+    return "none"
+
+
+def _zstandard():
+    try:
+        import zstandard
+    except ImportError as exc:
+        raise ImportError("zstd compression requires the 'zstandard' package (pip install zstandard).") from exc
+    return zstandard
+
+
+def _open_text(path: Path, mode: str):
+    """Open a (possibly compressed) report for text reading ('r'), writing ('w') or appending ('a')."""
+    compression = compression_for(path)
+    if compression == "gzip":
+        return gzip.open(path, mode + "t", encoding="utf-8")
+    if compression == "zstd":
+        zstandard = _zstandard()
+        raw = open(path, mode + "b")
+        if mode == "r":
+            stream = zstandard.ZstdDecompressor().stream_reader(raw, read_across_frames=True, closefd=True)
+        else:
+            stream = zstandard.ZstdCompressor().stream_writer(raw, closefd=True)
+        return io.TextIOWrapper(stream, encoding="utf-8")
+    return open(path, mode, encoding="utf-8")
+
+
+def _intact_lines(path: Path) -> Iterator[str]:
+    """Lines of a report, stopping quietly at a compressed stream cut off by an interrupted run."""
+    with _open_text(path, "r") as fh:
+        try:
+            yield from fh
+        except EOFError:
+            return
+
+
+def _drop_partial_tail(path: Path):
+    """
+    Remove a record left half-written by an interrupted run so appended records
+    start on a line of their own. A compressed report is rewritten with its
+    complete lines, since a truncated stream hides anything appended after it;
+    the rewrite replaces the file atomically, so no checkpoint is ever lost.
+    """
+    if compression_for(path) == "none":
+        with open(path, "rb+") as f:
+            data = f.read()
+            end = data.rfind(b"\n") + 1
+            if end != len(data):
+                f.truncate(end)
+        return
+    tmp_path = path.with_name(f".resume-{path.name}")
+    with _open_text(tmp_path, "w") as out:
+        for line in _intact_lines(path):
+            if line.endswith("\n"):
+                out.write(line)
+    os.replace(tmp_path, path)
+
+
+def _dumps(record: Dict[str, Any]) -> str:
+    return json.dumps(record, separators=(",", ":"), ensure_ascii=False, default=str)
+
+
+def compact_source(source: Dict[str, Any]) -> Dict[str, Any]:
+    """Keep only the stored source fields, dropping empty optional values."""
+    record = {"type": "source"}
+    for field in SOURCE_FIELDS:
+        value = source.get(field)
+        if value is None or (field in ("banner_url", "description", "source_url") and not value):
+            continue
+        if field == "items":
+            value = [ResearchItem.coerce(item, source.get("name", "")).to_dict() for item in value]
+        record[field] = value
+    return record
+
+
+def _typed_source(record: Dict[str, Any]) -> Dict[str, Any]:
+    """Turn a stored source record back into a pipeline source entry."""
+    record.pop("type", None)
+    name = record.get("name", "")
+    record["items"] = [ResearchItem.from_dict(item, name) for item in record.get("items", [])]
+    return record
+
+
+def render_markdown(overall_summary: str, sources: List[Dict[str, Any]]) -> str:
+    """Rebuild the combined pulse markdown from summaries and items."""
+    sections = [
+        f"## {src.get('name', 'source')}\n{src.get('summary', '')}\n\n"
+        f"{ResearchTool.format_items(src.get('name', 'source'), src.get('items', []))}"
+        for src in sources
+    ]
+    return f"# Pulse Summary\n{overall_summary}\n\n" + "\n\n".join(sections)
+
+
+class ReportWriter:
+    """
+    Incrementally write a compact report. Each record is flushed as soon as it
+    is written so a crashed run leaves every completed source on disk.
+    """
+
+    def __init__(self, path: Path, generated_at: str = None, days_back: int = None, append: bool = False):
+        self.path = Path(path)
+        existing = append and self.path.exists() and self.path.stat().st_size > 0
+        if existing:
+            _drop_partial_tail(self.path)
+        self._fh = _open_text(self.path, "a" if append else "w")
+        if not existing:
+            self._write({
+                "type": "header",
+                "format": REPORT_FORMAT,
+                "version": REPORT_FORMAT_VERSION,
+                "generated_at": generated_at,
+                "days_back": days_back,
+            })
+
+    def _write(self, record: Dict[str, Any]):
+        self._fh.write(_dumps(record) + "\n")
+        self._fh.flush()
+
+    def write_source(self, source: Dict[str, Any]):
+        self._write(compact_source(source))
+
+    def write_overview(self, overall_summary: str, source_order: List[str] = None, clusters: List[Dict[str, Any]] = None):
+        record = {"type": "overview", "overall_summary": overall_summary}
+        if source_order:
+            record["sources"] = list(source_order)
+        if clusters:
+            record["clusters"] = clusters
+        self._write(record)
+
+    def write_usage(self, llm_usage: Dict[str, Any]):
+        """Store the run's aggregated LLM usage (tokens, latency, cost)."""
+        self._write({"type": "usage", "llm_usage": llm_usage})
+
+    def close(self):
+        if self._fh is not None:
+            self._fh.close()
+            self._fh = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+class ReportReader:
+    """
+    Read a compact report lazily. Records that are not requested are skipped
+    by a cheap prefix check instead of being decoded.
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+
+    def _lines(self) -> Iterator[str]:
+        for line in _intact_lines(self.path):
+            if line.strip():
+                yield line
+
+    def _records(self, prefix: str = "") -> Iterator[Dict[str, Any]]:
+        for line in self._lines():
+            if prefix and not line.startswith(prefix):
+                continue
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError:
+                # A record cut off by an interrupted run; later records may follow a resume.
+                continue
+
+    def header(self) -> Dict[str, Any]:
+        for record in self._records('{"type":"header"'):
+            record.pop("type", None)
+            return record
+        return {}
+
+    def overview(self) -> Optional[str]:
+        record = self._overview_record()
+        return record.get("overall_summary") if record else None
+
+    def _overview_record(self) -> Optional[Dict[str, Any]]:
+        for record in self._records('{"type":"overview"'):
+            return record
+        return None
+
+    def source(self, name: str) -> Optional[Dict[str, Any]]:
+        prefix = '{"type":"source","name":' + json.dumps(name, ensure_ascii=False)
+        for record in self._records(prefix):
+            if record.get("name") == name:
+                return _typed_source(record)
+        return None
+
+    def sources(self) -> Iterator[Dict[str, Any]]:
+        for record in self._records('{"type":"source"'):
+            yield _typed_source(record)
+
+    def load(self) -> Dict[str, Any]:
+        """Load the full report into the same shape ``pulse_search`` returns."""
+        header = {}
+        overview = None
+        usage = None
+        sources = []
+        for record in self._records():
+            kind = record.pop("type", None)
+            if kind == "header":
+                header = record
+            elif kind == "source":
+                sources.append(_typed_source(record))
+            elif kind == "overview":
+                overview = record
+            elif kind == "usage":
+                usage = record.get("llm_usage")
+        if overview and overview.get("sources"):
+            rank = {name: i for i, name in enumerate(overview["sources"])}
+            sources.sort(key=lambda s: rank.get(s.get("name"), len(rank)))
+        return {
+            "generated_at": header.get("generated_at"),
+            "days_back": header.get("days_back"),
+            "overall_summary": (overview or {}).get("overall_summary", ""),
+            "sources": sources,
+            "clusters": (overview or {}).get("clusters", []),
+            "llm_usage": usage,
+        }
+
+
+def load_report(path: Path) -> Dict[str, Any]:
+    """Load either a compact report or a legacy ``report.json`` document."""
+    path = Path(path)
+    if path.suffix.lower() == ".json":
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        data["sources"] = [_typed_source(source) for source in data.get("sources", [])]
+        return data
+    return ReportReader(path).load()
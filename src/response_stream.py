@@ -0,0 +1,70 @@
+"""
+Incremental extraction of the <RESPONSE>...</RESPONSE> body from a streamed
+LLM completion, so partial text can be forwarded as soon as it arrives.
+"""
+from typing import List
+
+START_TAG = "<RESPONSE>"
+END_TAG = "</RESPONSE>"
+
+
+def _partial_tag_length(text: str, tag: str) -> int:
+    """Length of the longest suffix of text that is a proper prefix of tag."""
+    for k in range(min(len(tag) - 1, len(text)), 0, -1):
+        if text.endswith(tag[:k]):
+            return k
+    return 0
+
+
+class ResponseStreamParser:
+    """
+    Feed raw completion chunks; feed() returns the newly available text inside
+    the RESPONSE tags. Tags split across chunks are handled by holding back
+    any trailing text that could still turn into a tag.
+    """
+
+    def __init__(self):
+        self._buffer = ""
+        self._state = "before"
+        self._parts: List[str] = []
+
+    @property
+    def started(self) -> bool:
+        return self._state != "before"
+
+    @property
+    def done(self) -> bool:
+        return self._state == "done"
+
+    @property
+    def text(self) -> str:
+        """Response body seen so far, with leading and trailing whitespace stripped."""
+        return "".join(self._parts).strip()
+
+    def feed(self, chunk: str) -> str:
+        if self.done or not chunk:
+            return ""
+        self._buffer += chunk
+        if self._state == "before":
+            index = self._buffer.find(START_TAG)
+            if index == -1:
+                keep = _partial_tag_length(self._buffer, START_TAG)
+                self._buffer = self._buffer[len(self._buffer) - keep:]
+                return ""
+            self._buffer = self._buffer[index + len(START_TAG):]
+            self._state = "inside"
+        index = self._buffer.find(END_TAG)
+        if index != -1:
+            delta = self._buffer[:index]
+            self._buffer = ""
+            self._state = "done"
+        else:
+            safe = len(self._buffer) - _partial_tag_length(self._buffer, END_TAG)
+            delta = self._buffer[:safe]
+            self._buffer = self._buffer[safe:]
+        if not self._parts:
+            # Drop the whitespace that usually follows the opening tag.
+            delta = delta.lstrip()
+        if delta:
+            self._parts.append(delta)
+        return delta
@@ -0,0 +1,86 @@
+"""
+On-disk store of per-source pulse results, kept warm by the scheduler daemon.
+
+The in-memory copy of a source is revalidated against its file's mtime, so a
+reader sees refreshes written by a scheduler in another process.
+"""
+import json
+import os
+import re
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from src.tools.item import ResearchItem
+
+
+class ResultStore:
+    """Persist the latest processed result for each source as one JSON file."""
+
+    def __init__(self, root: str | Path = "output/cache"):
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._memory: Dict[str, Dict[str, Any]] = {}
+        self._mtimes: Dict[str, int] = {}
+
+    def _path(self, name: str) -> Path:
+        safe_name = re.sub(r"[^A-Za-z0-9_.-]", "_", name)
+        return self.root / f"{safe_name}.json"
+
+    def get(self, name: str) -> Optional[Dict[str, Any]]:
+        """Return the stored result for a source, or None if never refreshed."""
+        path = self._path(name)
+        try:
+            mtime = path.stat().st_mtime_ns
+        except OSError:
+            mtime = None
+        with self._lock:
+            cached = self._memory.get(name)
+            if cached is not None and (mtime is None or self._mtimes.get(name) == mtime):
+                return cached
+        if mtime is None:
+            return None
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                result = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return cached
+        result["items"] = [ResearchItem.from_dict(item, name) for item in result.get("items", [])]
+        with self._lock:
+            current = self._memory.get(name)
+            if current is None or result.get("fetched_at", 0) >= current.get("fetched_at", 0):
+                self._memory[name] = result
+            self._mtimes[name] = mtime
+            return self._memory[name]
+
+    def age(self, name: str) -> Optional[float]:
+        """Seconds since the source was last refreshed."""
+        result = self.get(name)
+        if not result or "fetched_at" not in result:
+            return None
+        return time.time() - result["fetched_at"]
+
+    def get_fresh(self, name: str, max_age_seconds: float) -> Optional[Dict[str, Any]]:
+        """Return the stored result only if it is younger than max_age_seconds."""
+        age = self.age(name)
+        if age is None or age > max_age_seconds:
+            return None
+        return self.get(name)
+
+    def put(self, name: str, result: Dict[str, Any]):
+        """Store a result, stamping it with the refresh time."""
+        record = dict(result)
+        record.setdefault("fetched_at", time.time())
+        stored = dict(record)
+        stored["items"] = [ResearchItem.coerce(item, name).to_dict() for item in record.get("items", [])]
+        path = self._path(name)
+        tmp_path = path.with_suffix(".json.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(stored, f, separators=(",", ":"), ensure_ascii=False, default=str)
+        mtime = tmp_path.stat().st_mtime_ns
+        os.replace(tmp_path, path)
+        with self._lock:
+            self._memory[name] = record
+            self._mtimes[name] = mtime
@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+Resident scheduler that keeps per-source pulse results warm.
+
+Each source configured in config.yaml is refreshed on its own interval
+(`refresh_minutes` on the source, else `scheduler.default_refresh_minutes`),
+with random jitter so sources do not all refresh at once. Results land in the
+agent's ResultStore, so `pulse_search` only assembles cached sections and runs
+the overview step.
+"""
+import argparse
+import heapq
+import random
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Tuple
+
+from src.agent import ResearcherAgent
+from src.result_store import ResultStore
+
+
+def _log(message: str):
+    # stderr, not stdout: the MCP server speaks its protocol over stdout and the
+    # scheduler logs from a background thread at any time.
+    print(f"[scheduler] {message}", file=sys.stderr, flush=True)
+
+
+class PulseScheduler:
+    """Refresh every source of a ResearcherAgent in the background."""
+
+    def __init__(self, agent: ResearcherAgent, jitter_seconds: float = None, max_workers: int = None):
+        self.agent = agent
+        scheduler_conf = agent.config.get("scheduler", {})
+        if agent.result_store is None:
+            agent.result_store = ResultStore(scheduler_conf.get("store_dir", "output/cache"))
+        self.store = agent.result_store
+        self.jitter_seconds = jitter_seconds if jitter_seconds is not None else scheduler_conf.get("jitter_seconds", 60)
+        self.retry_seconds = scheduler_conf.get("retry_seconds", 300)
+        workers = max_workers or agent.config.get("parallelism", {}).get("max_workers", 8)
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="pulse-scheduler")
+        self._stop = threading.Event()
+        self._wake = threading.Condition()
+        self._queue: List[Tuple[float, str]] = []
+        self._in_flight = set()
+        self._thread = None
+
+    def _jitter(self) -> float:
+        return random.uniform(0, self.jitter_seconds) if self.jitter_seconds else 0.0
+
+    def _initial_queue(self):
+        """Schedule stale sources immediately and warm ones when they expire."""
+        now = time.time()
+        for name in self.agent.tool_instances:
+            interval = self.agent.refresh_interval(name)
+            age = self.store.age(name)
+            if age is None or age >= interval:
+                due = now + self._jitter()
+            else:
+                due = now + (interval - age) + self._jitter()
+            heapq.heappush(self._queue, (due, name))
+
+    def _schedule(self, name: str, delay: float):
+        with self._wake:
+            heapq.heappush(self._queue, (time.time() + delay + self._jitter(), name))
+            self._wake.notify()
+
+    def _refresh(self, name: str):
+        try:
+            started = time.time()
+            self.agent.process_source(name)
+            _log(f"refreshed {name} in {time.time() - started:.1f}s")
+            delay = self.agent.refresh_interval(name)
+        except Exception as exc:
+            _log(f"refresh of {name} failed: {exc}")
+            delay = min(self.retry_seconds, self.agent.refresh_interval(name))
+        finally:
+            with self._wake:
+                self._in_flight.discard(name)
+        if not self._stop.is_set():
+            self._schedule(name, delay)
+
+    def _run(self):
+        with self._wake:
+            self._initial_queue()
+        while not self._stop.is_set():
+            with self._wake:
+                if not self._queue:
+                    self._wake.wait()
+                    continue
+                due, name = self._queue[0]
+                wait = due - time.time()
+                if wait > 0:
+                    self._wake.wait(timeout=wait)
+                    continue
+                heapq.heappop(self._queue)
+                if name in self._in_flight:
+                    continue
+                self._in_flight.add(name)
+            self._executor.submit(self._refresh, name)
+
+    def start(self) -> threading.Thread:
+        """Run the scheduler loop in a daemon thread."""
+        self._thread = threading.Thread(target=self._run, name="pulse-scheduler", daemon=True)
+        self._thread.start()
+        return self._thread
+
+    def stop(self):
+        self._stop.set()
+        with self._wake:
+            self._wake.notify_all()
+        if self._thread is not None:
+            self._thread.join()
+        self._executor.shutdown(wait=True)
+
+    def run_forever(self):
+        """Run in the foreground until interrupted."""
+        self.start()
+        try:
+            while self._thread.is_alive():
+                self._thread.join(timeout=1)
+        except KeyboardInterrupt:
+            _log("stopping...")
+        finally:
+            self.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Keep per-source pulse results warm in the background.")
+    parser.add_argument("--config", default="config.yaml", help="Path to config.yaml")
+    args = parser.parse_args()
+
+    scheduler = PulseScheduler(ResearcherAgent(args.config))
+    _log(f"warming {len(scheduler.agent.tool_instances)} sources into {scheduler.store.root}")
+    scheduler.run_forever()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,7 @@
 from .base_tool import ResearchTool
+from .item import ResearchItem
 from .web_search import WebSearchTool
 from .arxiv_tool import ArxivTool
 from .webscraper_tool import WebScraperTool
 
-__all__ = ["ResearchTool", "WebSearchTool", "ArxivTool", "WebScraperTool"]
\ No newline at end of file
+__all__ = ["ResearchTool", "ResearchItem", "WebSearchTool", "ArxivTool", "WebScraperTool"]
\ No newline at end of file
@@ -1,5 +1,6 @@
 from .base_tool import ResearchTool
-from typing import List, Dict, Any
+from .item import ResearchItem
+from typing import List
 import arxiv
 from datetime import datetime, timedelta, timezone
 
@@ -7,7 +8,7 @@ class ArxivTool(ResearchTool):
     def __init__(self, topics: List[str]):
         super().__init__("arxiv", topics)
 
-    def search(self, query: str, topics: List[str] = None, days_back: int = 7) -> List[Dict[str, Any]]:
+    def search(self, query: str, topics: List[str] = None, days_back: int = 7) -> List[ResearchItem]:
         if topics:
             search_terms = topics + [query] if query else topics
         else:
@@ -18,20 +19,25 @@ class ArxivTool(ResearchTool):
 
         # Search with date filter
         since = datetime.now(timezone.utc) - timedelta(days=days_back)
+        papers = self._cached(("arxiv", full_query), lambda: self._fetch_papers(full_query))
+
+        results = []
+        for paper in papers:
+            if paper.published >= since:
+                results.append(ResearchItem(
+                    title=paper.title,
+                    summary=paper.summary[:300] + "..." if len(paper.summary) > 300 else paper.summary,
+                    link=paper.pdf_url,
+                    source=self.name,
+                    published=paper.published,
+                ))
+        return results
+
+    def _fetch_papers(self, full_query: str) -> List[arxiv.Result]:
         search = arxiv.Search(
             query=full_query,
             max_results=10,
             sort_by=arxiv.SortCriterion.SubmittedDate,
             sort_order=arxiv.SortOrder.Descending
         )
-
-        results = []
-        for paper in search.results():
-            if paper.published >= since:
-                results.append({
-                    'title': paper.title,
-                    'summary': paper.summary[:300] + "..." if len(paper.summary) > 300 else paper.summary,
-                    'link': paper.pdf_url,
-                    'date': paper.published.strftime('%Y-%m-%d')
-                })
-        return results
\ No newline at end of file
+        return list(search.results())
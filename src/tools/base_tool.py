@@ -1,22 +1,29 @@
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Callable, Hashable, Optional
 from datetime import datetime, timedelta
 import yaml
+from .item import ResearchItem
 
 class ResearchTool(ABC):
+    # Optional FetchCache shared across agents so overlapping sources are fetched once.
+    fetch_cache = None
+    # When False, search returns every matching item and the caller applies
+    # result_limit() itself, e.g. after ranking so feed order does not decide.
+    limit_results = True
+
     def __init__(self, name: str, topics: List[str]):
         self.name = name
         self.topics = topics
 
     @abstractmethod
-    def search(self, query: str, topics: List[str] = None, days_back: int = 7) -> List[Dict[str, Any]]:
+    def search(self, query: str, topics: List[str] = None, days_back: int = 7) -> List[ResearchItem]:
         """
         Search for content based on query and topics.
-        Returns list of dicts with keys: title, summary, link, date
+        Returns a list of ResearchItem (title, summary, link, source, published).
         """
         pass
 
-    def get_recent(self, topics: List[str] = None, days_back: int = 1) -> List[Dict[str, Any]]:
+    def get_recent(self, topics: List[str] = None, days_back: int = 1) -> List[ResearchItem]:
         """
         Get recent developments from the source.
         """
@@ -25,21 +32,37 @@ class ResearchTool(ABC):
         # Default implementation: search with empty query
         return self.search("", topics, days_back)
 
-    def format_output(self, results: List[Dict[str, Any]]) -> str:
+    def result_limit(self) -> Optional[int]:
+        """Maximum number of items this source reports, or None for no cap."""
+        return None
+
+    def _cached(self, key: Hashable, fetch: Callable[[], Any]) -> Any:
+        """Run fetch once per key when a shared fetch cache is attached."""
+        if self.fetch_cache is None:
+            return fetch()
+        return self.fetch_cache.get_or_fetch(key, fetch)
+
+    def format_output(self, results: List[ResearchItem]) -> str:
         """
         Format results into a summary string.
         """
+        return ResearchTool.format_items(self.name, results)
+
+    @staticmethod
+    def format_items(name: str, results: List[ResearchItem | Dict[str, Any]]) -> str:
+        """
+        Format results for the named source without needing a tool instance.
+        Used to rebuild report markdown from saved items.
+        """
         if not results:
-            return f"No recent results from {self.name}."
+            return f"No recent results from {name}."
 
-        output = f"**{self.name.title()}:**\n"
-        output += f"Description: {results[0].get('description', 'No description available.')}\n\n"
+        results = [ResearchItem.coerce(item, name) for item in results]
+        output = f"**{name.title()}:**\n"
+        output += f"Description: {results[0].description or 'No description available.'}\n\n"
         for item in results:
-            title = item.get('title', 'No title')
-            summary = item.get('summary', 'No summary')[:200] + "..." if len(item.get('summary', '')) > 200 else item.get('summary', '')
-            link = item.get('link', '#')
-            date = item.get('date', 'Unknown date')
-            output += f"- **{title}**: {summary} [Link]({link}) (Posted on: {date})\n"
+            summary = item.summary[:200] + "..." if len(item.summary) > 200 else item.summary
+            output += f"- **{item.title}**: {summary} [Link]({item.link}) (Posted on: {item.date})\n"
         return output
 
     @staticmethod
@@ -0,0 +1,77 @@
+import re
+from datetime import datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
+from dateutil import parser
+
+# Relative dates as search engines show them, e.g. "3 days ago", "1 hour ago".
+_RELATIVE_DATE = re.compile(r"^(\d+|an?)\s+(second|minute|hour|day|week|month|year)s?\s+ago$", re.IGNORECASE)
+_UNIT_SECONDS = {
+    "second": 1,
+    "minute": 60,
+    "hour": 3600,
+    "day": 86400,
+    "week": 7 * 86400,
+    "month": 30 * 86400,
+    "year": 365 * 86400,
+}
+
+
+def _as_utc(dt: datetime) -> datetime:
+    """Treat naive datetimes as UTC so every item date is comparable."""
+    if dt.tzinfo is None:
+        return dt.replace(tzinfo=timezone.utc)
+    return dt.astimezone(timezone.utc)
+
+
+def _parse_relative(text: str) -> datetime | None:
+    """Resolve "N units ago" (and "yesterday"/"today") against the current time."""
+    lowered = text.lower()
+    now = datetime.now(timezone.utc)
+    if lowered in ("today", "just now"):
+        return now
+    if lowered == "yesterday":
+        return now - timedelta(days=1)
+    match = _RELATIVE_DATE.match(lowered)
+    if not match:
+        return None
+    count = 1 if match.group(1) in ("a", "an") else int(match.group(1))
+    return now - timedelta(seconds=count * _UNIT_SECONDS[match.group(2)])
+
+
+@lru_cache(maxsize=4096)
+def _parse_fuzzy(text: str, year: int) -> datetime | None:
+    # Fields missing from text come from a fixed default (Jan 1 of the given
+    # year) rather than today, so a cached result never goes stale within a
+    # year; year is part of the cache key.
+    try:
+        return _as_utc(parser.parse(text, default=datetime(year, 1, 1)))
+    except (ValueError, TypeError, OverflowError):
+        return None
+
+
+def parse_date(text: str | None) -> datetime | None:
+    """
+    Parse a date string into an aware UTC datetime.
+    ISO-8601 and RFC-822 (feed) dates take a fast path, and relative dates
+    ("3 days ago") are resolved against now; anything else falls back to a
+    memoized dateutil parse. Returns None when unparseable.
+    """
+    if not text:
+        return None
+    text = text.strip()
+    if not text:
+        return None
+    try:
+        return _as_utc(datetime.fromisoformat(text))
+    except ValueError:
+        pass
+    if "," in text or text[:3].isalpha():
+        try:
+            return _as_utc(parsedate_to_datetime(text))
+        except (ValueError, TypeError, IndexError):
+            pass
+    relative = _parse_relative(text)
+    if relative is not None:
+        return relative
+    return _parse_fuzzy(text, datetime.now(timezone.utc).year)
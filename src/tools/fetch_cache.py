@@ -0,0 +1,39 @@
+from concurrent.futures import Future
+import threading
+from typing import Any, Callable, Dict, Hashable
+
+
+class FetchCache:
+    """
+    Thread-safe memo shared by several agents/tools. The first caller for a key
+    runs the fetch; concurrent callers for the same key wait for its result.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._futures: Dict[Hashable, Future] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get_or_fetch(self, key: Hashable, fetch: Callable[[], Any]) -> Any:
+        with self._lock:
+            future = self._futures.get(key)
+            owner = future is None
+            if owner:
+                future = Future()
+                self._futures[key] = future
+                self.misses += 1
+            else:
+                self.hits += 1
+        if owner:
+            try:
+                future.set_result(fetch())
+            except BaseException as exc:
+                # Do not cache failures; the next caller retries.
+                with self._lock:
+                    self._futures.pop(key, None)
+                future.set_exception(exc)
+        return future.result()
+
+    def __len__(self) -> int:
+        return len(self._futures)
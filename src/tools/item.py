@@ -0,0 +1,81 @@
+from dataclasses import dataclass, field
+from datetime import datetime
+import hashlib
+from typing import Any, Dict, Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from .dates import parse_date
+
+
+TRACKING_PARAMS = {"ref", "fbclid", "gclid", "mc_cid", "mc_eid"}
+
+
+def canonical_url(link: str) -> str:
+    """Normalize a link for de-duplication: lowercase host, no fragment or tracking params."""
+    if not link or link == "#":
+        return link or "#"
+    parts = urlsplit(link.strip())
+    query = urlencode([
+        (k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+        if not (k.lower().startswith("utm_") or k.lower() in TRACKING_PARAMS)
+    ])
+    path = parts.path.rstrip("/") or "/"
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), path, query, ""))
+
+
+@dataclass(slots=True)
+class ResearchItem:
+    """
+    One result from a research tool. Dates are parsed once into `published`
+    (aware UTC); `url` and `content_hash` are derived at construction.
+    """
+    title: str
+    summary: str
+    link: str
+    source: str = ""
+    published: Optional[datetime] = None
+    description: str = ""
+    score: Optional[float] = None
+    url: str = field(init=False)
+    content_hash: str = field(init=False)
+
+    def __post_init__(self):
+        self.url = canonical_url(self.link)
+        self.content_hash = hashlib.sha1(f"{self.url}\n{self.title}".encode("utf-8")).hexdigest()[:16]
+
+    @property
+    def date(self) -> str:
+        """Display date, YYYY-MM-DD."""
+        return self.published.strftime("%Y-%m-%d") if self.published else "Unknown date"
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Compact JSON form; source, url and hash are implied by the enclosing record."""
+        data = {
+            "title": self.title,
+            "summary": self.summary,
+            "link": self.link,
+            "published": self.published.isoformat() if self.published else None,
+        }
+        if self.description:
+            data["description"] = self.description
+        if self.score is not None:
+            data["score"] = self.score
+        return data
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any], source: str = "") -> "ResearchItem":
+        """Build from a stored dict (compact `published` or legacy `date` key)."""
+        return cls(
+            title=data.get("title") or "No title",
+            summary=data.get("summary") or "",
+            link=data.get("link") or "#",
+            source=data.get("source") or source,
+            published=parse_date(data.get("published") or data.get("date")),
+            description=data.get("description") or "",
+            score=data.get("score"),
+        )
+
+    @classmethod
+    def coerce(cls, item: "ResearchItem | Dict[str, Any]", source: str = "") -> "ResearchItem":
+        """Return items unchanged; convert dicts from legacy reports or callers."""
+        return item if isinstance(item, cls) else cls.from_dict(item, source)
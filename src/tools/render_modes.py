@@ -0,0 +1,91 @@
+from contextlib import contextmanager
+import json
+import os
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Optional
+
+try:
+    import fcntl
+except ImportError:  # Windows: merging alone keeps most concurrent entries.
+    fcntl = None
+
+
+class RenderModeStore:
+    """
+    Remember per source whether its listing page needs JavaScript rendering,
+    so static-first scraping only pays for a failed plain fetch once per TTL.
+    Persisted as a small JSON file when a path is given. Writes merge with the
+    file's current contents so separate processes sharing it don't drop each
+    other's entries; within a process use shared() to get one store per path.
+    """
+
+    _registry: Dict[Path, "RenderModeStore"] = {}
+    _registry_lock = threading.Lock()
+
+    def __init__(self, path: str | Path = None, ttl_hours: float = 24):
+        self.path = Path(path) if path else None
+        self.ttl_seconds = ttl_hours * 3600
+        self._lock = threading.Lock()
+        self._modes: Dict[str, Dict[str, float | bool]] = self._read_file()
+
+    @classmethod
+    def shared(cls, path: str | Path, ttl_hours: float = 24) -> "RenderModeStore":
+        """The process-wide store for path, created on first use."""
+        key = Path(path).resolve()
+        with cls._registry_lock:
+            store = cls._registry.get(key)
+            if store is None:
+                store = cls._registry[key] = cls(path, ttl_hours)
+            return store
+
+    def _read_file(self) -> Dict[str, Dict[str, float | bool]]:
+        if not self.path or not self.path.exists():
+            return {}
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return {}
+        return data if isinstance(data, dict) else {}
+
+    def needs_js(self, name: str) -> Optional[bool]:
+        """True/False if known and not expired, else None (probe again)."""
+        with self._lock:
+            entry = self._modes.get(name)
+        if not entry or time.time() - entry.get("checked_at", 0) > self.ttl_seconds:
+            return None
+        return bool(entry.get("needs_js"))
+
+    def remember(self, name: str, needs_js: bool):
+        with self._lock:
+            self._modes[name] = {"needs_js": needs_js, "checked_at": time.time()}
+            if not self.path:
+                return
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with self._file_lock():
+                # Keep the newest entry per source from the file and from memory.
+                for other, entry in self._read_file().items():
+                    mine = self._modes.get(other)
+                    if mine is None or entry.get("checked_at", 0) > mine.get("checked_at", 0):
+                        self._modes[other] = entry
+                with tempfile.NamedTemporaryFile(
+                    "w", encoding="utf-8", dir=self.path.parent, prefix=self.path.name, suffix=".tmp", delete=False
+                ) as f:
+                    json.dump(self._modes, f, indent=2)
+                os.replace(f.name, self.path)
+
+    @contextmanager
+    def _file_lock(self):
+        """Advisory lock serializing read-merge-write across stores and processes."""
+        if fcntl is None:
+            yield
+            return
+        with open(self.path.with_name(self.path.name + ".lock"), "a") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
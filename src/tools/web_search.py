@@ -1,5 +1,7 @@
 from .base_tool import ResearchTool
-from typing import List, Dict, Any
+from .dates import parse_date
+from .item import ResearchItem
+from typing import List
 from langchain_community.utilities import SerpAPIWrapper
 from datetime import datetime, timedelta
 import os
@@ -13,7 +15,10 @@ class WebSearchTool(ResearchTool):
         else:
             self.searcher = None
 
-    def search(self, query: str, topics: List[str] = None, days_back: int = 7) -> List[Dict[str, Any]]:
+    def result_limit(self) -> int:
+        return 5
+
+    def search(self, query: str, topics: List[str] = None, days_back: int = 7) -> List[ResearchItem]:
         if not self.searcher:
             return []
 
@@ -26,13 +31,17 @@ class WebSearchTool(ResearchTool):
         if days_back < 30:
             full_query += f" after:{(datetime.now() - timedelta(days=days_back)).strftime('%Y-%m-%d')}"
 
-        results = self.searcher.results(full_query)
+        results = self._cached(("web_search", full_query), lambda: self.searcher.results(full_query))
+        organic = results.get('organic_results', [])
+        if self.limit_results:
+            organic = organic[:self.result_limit()]
         parsed = []
-        for res in results.get('organic_results', [])[:5]:
-            parsed.append({
-                'title': res.get('title', ''),
-                'summary': res.get('snippet', ''),
-                'link': res.get('link', ''),
-                'date': res.get('date', '')
-            })
+        for res in organic:
+            parsed.append(ResearchItem(
+                title=res.get('title', ''),
+                summary=res.get('snippet', ''),
+                link=res.get('link', ''),
+                source=self.name,
+                published=parse_date(res.get('date')),
+            ))
         return parsed
\ No newline at end of file
@@ -1,28 +1,35 @@
 from .base_tool import ResearchTool
+from .dates import parse_date
+from .item import ResearchItem
 from typing import List, Dict, Any
 import requests
 import html
 from bs4 import BeautifulSoup
 import feedparser
 from datetime import datetime, timedelta, timezone
-from dateutil import parser
 import re
-from dateutil import parser
+
+# Resource types Playwright skips when rendering; article text never needs them.
+BLOCKED_RESOURCE_TYPES = ("image", "font", "stylesheet", "media")
+
 
 class WebScraperTool(ResearchTool):
+    # Optional RenderModeStore shared by scrapers to remember which sources need JS rendering.
+    render_modes = None
+
     def __init__(self, name: str, config: Dict[str, Any]):
         self.name = name
         self.config = config
         self.topics = config.get('topics', [])
 
-    def _parse_date(self, date_str: str) -> datetime or None:
-        """Helper to parse date string into datetime object."""
-        try:
-            return parser.parse(date_str)
-        except (ValueError, TypeError):
-            return None
+    def result_limit(self) -> int:
+        return self.config.get('max_results', 5)
 
-    def search(self, query: str, topics: List[str] = None, days_back: int = 7) -> List[Dict[str, Any]]:
+    def _parse_date(self, date_str: str) -> datetime | None:
+        """Helper to parse date string into an aware UTC datetime."""
+        return parse_date(date_str)
+
+    def search(self, query: str, topics: List[str] = None, days_back: int = 7) -> List[ResearchItem]:
         if self.config['type'] == 'rss':
             return self._search_rss(query, topics, days_back)
         elif self.config['type'] == 'html':
@@ -56,16 +63,10 @@ class WebScraperTool(ResearchTool):
             return False
         return bool(re.fullmatch(r"\d{4}", date_str.strip()))
 
-    def _search_rss(self, query: str, topics: List[str] = None, days_back: int = 7) -> List[Dict[str, Any]]:
-        feed_url = self.config.get("url") or self.config.get("feed_url")
-        if not feed_url:
-            return []
-
+    def _parse_rss_entries(self, feed_url: str) -> List[Dict[str, Any]]:
+        """Fetch a feed and extract the fields used for filtering and output."""
         feed = feedparser.parse(feed_url)
-        results = []
-        since = datetime.now(timezone.utc) - timedelta(days=days_back)
-        max_results = self.config.get("max_results", 5)
-
+        entries = []
         for entry in feed.entries:
             # published_parsed may be missing; try updated_parsed; else skip recency filter
             published_dt = None
@@ -75,15 +76,33 @@ class WebScraperTool(ResearchTool):
                 published_dt = datetime(*entry.updated_parsed[:6], tzinfo=timezone.utc)
 
             published_text = getattr(entry, "published", None) or getattr(entry, "updated", None)
-            year_only_date = self._is_year_only_date(published_text)
+            entries.append({
+                "title": getattr(entry, "title", "No title"),
+                "summary": self._clean_html_fragment(self._best_rss_text(entry)),
+                "link": getattr(entry, "link", "#"),
+                "published_dt": published_dt,
+                "year_only_date": self._is_year_only_date(published_text),
+            })
+        return entries
 
-            if published_dt and published_dt < since and not year_only_date:
+    def _search_rss(self, query: str, topics: List[str] = None, days_back: int = 7) -> List[ResearchItem]:
+        feed_url = self.config.get("url") or self.config.get("feed_url")
+        if not feed_url:
+            return []
+
+        entries = self._cached(("rss", feed_url), lambda: self._parse_rss_entries(feed_url))
+        results = []
+        since = datetime.now(timezone.utc) - timedelta(days=days_back)
+        max_results = self.result_limit()
+
+        for entry in entries:
+            published_dt = entry["published_dt"]
+            if published_dt and published_dt < since and not entry["year_only_date"]:
                 continue
 
-            title = getattr(entry, "title", "No title")
-            raw = self._best_rss_text(entry)
-            summary = self._clean_html_fragment(raw)
-            link = getattr(entry, "link", "#")
+            title = entry["title"]
+            summary = entry["summary"]
+            link = entry["link"]
 
             content = (title + " " + summary).lower()
             effective_topics = topics if topics is not None else self.topics
@@ -98,53 +117,142 @@ class WebScraperTool(ResearchTool):
                 if effective_topics and not any(t.lower() in content for t in effective_topics):
                     continue
 
-            date_str = (published_dt or datetime.now(timezone.utc)).strftime("%Y-%m-%d")
-            results.append({
-                "title": title,
-                "summary": (summary[:300] + "...") if len(summary) > 300 else summary,
-                "link": link,
-                "date": date_str,
-            })
+            results.append(ResearchItem(
+                title=title,
+                summary=(summary[:300] + "...") if len(summary) > 300 else summary,
+                link=link,
+                source=self.name,
+                published=published_dt or datetime.now(timezone.utc),
+            ))
 
-            if len(results) >= max_results:
+            if self.limit_results and len(results) >= max_results:
                 break
 
         return results
 
-    def _search_html(self, query: str, topics: List[str] = None, days_back: int = 7) -> List[Dict[str, Any]]:
+    def _search_html(self, query: str, topics: List[str] = None, days_back: int = 7) -> List[ResearchItem]:
         search_terms = topics + [query] if query else topics if topics else self.topics
         base_url = self.config['base_url']
         full_query = " ".join(search_terms)
         url = base_url + requests.utils.quote(full_query)
 
-        use_playwright = self.config.get('use_playwright', False)
-        if use_playwright:
-            from playwright.sync_api import sync_playwright
-            with sync_playwright() as p:
-                browser = p.chromium.launch()
+        articles = self._cached(
+            ("html", url, bool(self.config.get('use_playwright', False)), self._selector_key()),
+            lambda: self._parse_html_articles(url),
+        )
+        if not articles:
+            return []
+        results = []
+        since = datetime.now(timezone.utc) - timedelta(days=days_back)
+
+        if self.limit_results:
+            articles = articles[:self.result_limit()]
+        for i, article in enumerate(articles):
+            title = article['title']
+            # Dates are parsed once; missing or unparseable dates count as today.
+            published = self._parse_date(article['date_text']) or datetime.now(timezone.utc)
+            date = published.strftime('%Y-%m-%d')
+
+            if published >= since:
+                print(f"Article {i+1} is recent: {title}, posted on {date}")
+                results.append(ResearchItem(
+                    title=title,
+                    summary=article['summary'],
+                    link=article['link'],
+                    source=self.name,
+                    published=published,
+                ))
+            else:
+                print(f"Article {i+1} is not recent: {title}, posted on {date}")
+        return results
+
+    def _selector_key(self) -> tuple:
+        return tuple(
+            self.config.get(key)
+            for key in ('article_selector', 'title_selector', 'link_selector', 'summary_selector', 'date_selector')
+        )
+
+    def _static_fetch(self, url: str, check_status: bool = False) -> str:
+        headers = {
+            'User-Agent': 'PostmanRuntime/7.49.1',
+            'Accept': '*/*',
+            'Accept-Language': 'en-US,en;q=0.5',
+            'Accept-Encoding': 'gzip, deflate',
+            'Connection': 'keep-alive',
+            'Upgrade-Insecure-Requests': '1',
+        }
+        response = requests.get(url, headers=headers, timeout=self.config.get('timeout_seconds', 30))
+        if check_status:
+            response.raise_for_status()
+        return response.text
+
+    def _render_fetch(self, url: str) -> str:
+        """Render the page in Chromium, blocking non-essential resources and waiting only for the article selector."""
+        from playwright.sync_api import sync_playwright
+        blocked = set(self.config.get('blocked_resource_types', BLOCKED_RESOURCE_TYPES))
+
+        def _route(route):
+            if route.request.resource_type in blocked:
+                route.abort()
+            else:
+                route.continue_()
+
+        with sync_playwright() as p:
+            browser = p.chromium.launch()
+            try:
                 page = browser.new_page()
-                page.goto(url)
-                page.wait_for_selector(self.config['article_selector'])
+                page.route("**/*", _route)
+                page.goto(url, wait_until="domcontentloaded")
+                page.wait_for_selector(self.config['article_selector'], state="attached")
                 html = page.content()
+            finally:
                 browser.close()
+        return html
+
+    def _load_soup(self, url: str) -> BeautifulSoup:
+        """
+        Fetch and parse a listing page. Sources with use_playwright are tried
+        with a plain HTTP fetch first; Chromium is only used when the article
+        selector does not match, and the outcome is remembered per source.
+        """
+        if not self.config.get('use_playwright', False):
+            return BeautifulSoup(self._static_fetch(url), 'html.parser')
+
+        if self.config.get('static_first', True) and self._needs_js() is not True:
+            try:
+                soup = BeautifulSoup(self._static_fetch(url, check_status=True), 'html.parser')
+            except requests.RequestException as exc:
+                # A transient failure or error page (429/503/...) says nothing
+                # about whether the page needs JS.
+                print(f"Static fetch failed for {self.name}: {exc}; rendering with Playwright.")
+            else:
+                if soup.select_one(self.config['article_selector']) is not None:
+                    self._remember_needs_js(False)
+                    return soup
+                print(f"Static HTML for {self.name} has no matching articles; rendering with Playwright.")
+                self._remember_needs_js(True)
+        return BeautifulSoup(self._render_fetch(url), 'html.parser')
+
+    def _needs_js(self) -> bool | None:
+        if self.render_modes is not None:
+            return self.render_modes.needs_js(self.name)
+        return getattr(self, '_needs_js_memo', None)
+
+    def _remember_needs_js(self, needs_js: bool):
+        if self.render_modes is not None:
+            self.render_modes.remember(self.name, needs_js)
         else:
-            headers = {
-                'User-Agent': 'PostmanRuntime/7.49.1',
-                'Accept': '*/*',
-                'Accept-Language': 'en-US,en;q=0.5',
-                'Accept-Encoding': 'gzip, deflate',
-                'Connection': 'keep-alive',
-                'Upgrade-Insecure-Requests': '1',
-            }
-            response = requests.get(url, headers=headers)
-            html = response.text
-        
-        soup = BeautifulSoup(html, 'html.parser')
+            self._needs_js_memo = needs_js
+
+    def _parse_html_articles(self, url: str) -> List[Dict[str, Any]]:
+        """Fetch a listing page and extract raw article fields via the configured selectors."""
+        soup = self._load_soup(url)
 
         article_selector = self.config['article_selector']
         title_sel = self.config['title_selector']
         link_sel = self.config['link_selector']
         summary_sel = self.config.get('summary_selector')
+        date_sel = self.config.get('date_selector')
 
         articles = soup.select(article_selector)
         print(f"=== Scraping Articles From {self.name}===")
@@ -152,54 +260,17 @@ class WebScraperTool(ResearchTool):
         if not articles:
             print("No articles found with the given selector.")
             return []
-        results = []
-        since = datetime.now() - timedelta(days=days_back)
 
-        for i, article in enumerate(articles[:self.config.get('max_results', 5)]):
+        parsed = []
+        for article in articles:
             title_tag = article.select_one(title_sel)
-            title = title_tag.text.strip() if title_tag else "No title"
             link_tag = article.select_one(link_sel)
-            link = link_tag['href'] if link_tag and 'href' in link_tag.attrs else "#"
             summary_tag = article.select_one(summary_sel) if summary_sel else None
-            summary = summary_tag.text.strip() if summary_tag else "No summary"
-            
-            # Parse date using date_selector
-            date_sel = self.config.get('date_selector')
-            date = None
-            if date_sel:
-                date_tag = article.select_one(date_sel)
-                date_text = date_tag.text.strip() if date_tag else None
-                if date_text:
-                    parsed = self._parse_date(date_text)
-                    if parsed:
-                        date = parsed.strftime('%Y-%m-%d')
-                    else:
-                        date = datetime.now(timezone.utc).strftime('%Y-%m-%d')  # Fallback
-                else:
-                    date = datetime.now(timezone.utc).strftime('%Y-%m-%d')
-            else:
-                date = datetime.now(timezone.utc).strftime('%Y-%m-%d')
-            
-            # Check if within days_back
-            if date:
-                article_date = self._parse_date(date)
-                if article_date and article_date >= since:
-                    print(f"Article {i+1} is recent: {title}, posted on {date}")
-                    results.append({
-                        'title': title,
-                        'summary': summary,
-                        'link': link,
-                        'date': date
-                    })
-                else:
-                    print(f"Article {i+1} is not recent: {title}, posted on {date}")
-            else:
-                # If no date, assume recent
-                results.append({
-                    'title': title,
-                    'description': self.config.get('description', ''),
-                    'summary': summary,
-                    'link': link,
-                    'date': date
-                })
-        return results
+            date_tag = article.select_one(date_sel) if date_sel else None
+            parsed.append({
+                'title': title_tag.text.strip() if title_tag else "No title",
+                'link': link_tag['href'] if link_tag and 'href' in link_tag.attrs else "#",
+                'summary': summary_tag.text.strip() if summary_tag else "No summary",
+                'date_text': (date_tag.text.strip() or None) if date_tag else None,
+            })
+        return parsed
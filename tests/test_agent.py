@@ -0,0 +1,387 @@
+import json
+import os
+import tempfile
+import threading
+import time
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+os.environ.setdefault("FOUNDRY_DEPLOYMENT", "test-model")
+os.environ.setdefault("FOUNDRY_API_KEY", "test-key")
+os.environ.setdefault("FOUNDRY_ENDPOINT", "http://127.0.0.1:9")
+
+import anthropic
+import httpx
+from langchain_anthropic import ChatAnthropic
+from langchain_core.messages import AIMessage
+
+from src.agent import ResearcherAgent
+from src.llm_ledger import LLMCall, LLMLedger
+from src.result_store import ResultStore
+from src.tools.item import ResearchItem
+from src.tools.webscraper_tool import WebScraperTool
+
+
+def _items(n):
+    return [ResearchItem(title=f"Post {i}", summary="x" * 200, link=f"http://e/{i}") for i in range(n)]
+
+
+class TestSourceSummarization(unittest.TestCase):
+    def setUp(self):
+        self.agent = ResearcherAgent()
+        self.lock = threading.Lock()
+        self.calls = []
+
+        def fake_summary(text, source=None):
+            with self.lock:
+                self.calls.append("map")
+            return "- partial"
+
+        def fake_reduce(partials, source=None):
+            with self.lock:
+                self.calls.append("reduce")
+            return "- merged"
+
+        self.agent._generate_source_summary = fake_summary
+        self.agent._reduce_summaries = fake_reduce
+
+    def test_small_source_uses_single_call(self):
+        items = _items(2)
+        summary = self.agent._summarize_source("src", items, self.agent.tool_instances["arxiv"].format_output(items))
+        self.assertEqual(summary, "- partial")
+        self.assertEqual(self.calls, ["map"])
+
+    def test_large_source_is_mapped_and_reduced(self):
+        self.agent.config["summarization"] = {"map_reduce_threshold_tokens": 100, "chunk_tokens": 200}
+        items = _items(8)
+        summary = self.agent._summarize_source("src", items, self.agent.tool_instances["arxiv"].format_output(items))
+        self.assertEqual(summary, "- merged")
+        self.assertEqual(self.calls.count("map"), 4)
+        self.assertGreaterEqual(self.calls.count("reduce"), 1)
+
+
+def _status_error(status):
+    response = httpx.Response(status, request=httpx.Request("POST", "http://stub/v1/messages"))
+    error_type = anthropic.InternalServerError if status >= 500 else anthropic.BadRequestError
+    return error_type(f"{status} error", response=response, body=None)
+
+
+class _FlakyLLM:
+    model = "test-model"
+
+    def __init__(self, failures, status=503):
+        self.failures = failures
+        self.status = status
+        self.attempts = 0
+
+    def invoke(self, messages):
+        self.attempts += 1
+        if self.failures:
+            self.failures -= 1
+            raise _status_error(self.status)
+        return AIMessage(
+            content="<RESPONSE>ok</RESPONSE>",
+            usage_metadata={
+                "input_tokens": 120,
+                "output_tokens": 30,
+                "total_tokens": 150,
+                "input_token_details": {"cache_read": 100},
+            },
+        )
+
+
+class TestLLMLedger(unittest.TestCase):
+    def setUp(self):
+        self.agent = ResearcherAgent()
+        self.agent.config["llm"] = {
+            "retry_backoff_seconds": 0,
+            "pricing": {"input_per_mtok": 10, "cached_input_per_mtok": 1, "output_per_mtok": 50},
+        }
+        self.agent.ledger.pricing = self.agent.config["llm"]["pricing"]
+
+    def test_records_tokens_retries_and_cost(self):
+        self.agent.llm = _FlakyLLM(failures=1)
+        self.assertEqual(self.agent._generate_source_summary("text", source="arxiv"), "ok")
+
+        call = self.agent.ledger.calls()[0]
+        self.assertEqual((call.stage, call.source, call.retries), ("source_summary", "arxiv", 1))
+        self.assertEqual((call.prompt_tokens, call.completion_tokens, call.cached_prompt_tokens), (120, 30, 100))
+
+        usage = self.agent.ledger.summarize()
+        self.assertEqual(usage["by_source"]["arxiv"]["calls"], 1)
+        self.assertAlmostEqual(usage["total"]["cost_usd"], (20 * 10 + 100 * 1 + 30 * 50) / 1_000_000)
+
+    def test_failed_call_is_recorded_and_raised(self):
+        self.agent.config["llm"]["max_retries"] = 1
+        self.agent.llm = _FlakyLLM(failures=5)
+        with self.assertRaises(anthropic.InternalServerError):
+            self.agent._invoke_llm("sys", "user", stage="overview")
+        usage = self.agent.ledger.summarize()["total"]
+        self.assertEqual((usage["calls"], usage["failed"], usage["retries"]), (1, 1, 1))
+
+    def test_client_errors_are_not_retried(self):
+        self.agent.llm = _FlakyLLM(failures=5, status=400)
+        with self.assertRaises(anthropic.BadRequestError):
+            self.agent._invoke_llm("sys", "user")
+        self.assertEqual(self.agent.llm.attempts, 1)
+
+    def test_runs_only_count_their_own_calls(self):
+        self.agent.llm = _FlakyLLM(failures=0)
+        self.agent._invoke_llm("sys", "user", stage="scheduler_refresh")
+        with self.agent.ledger.run() as run_id:
+            self.agent._map_sources(lambda name: self.agent._invoke_llm("sys", name, source=name), ["a", "b"])
+        self.assertEqual(self.agent.ledger.summarize(run_id)["total"]["calls"], 2)
+        self.assertEqual(self.agent.ledger.summarize()["total"]["calls"], 3)
+
+    def test_ledger_is_bounded(self):
+        ledger = LLMLedger(max_calls=3)
+        for i in range(5):
+            ledger.record(LLMCall(stage=str(i), model="m"))
+        self.assertEqual([c.stage for c in ledger.calls()], ["2", "3", "4"])
+
+
+class TestResumablePulse(unittest.TestCase):
+    def setUp(self):
+        self.agent = ResearcherAgent()
+        self.agent.config["ranking"] = {"enabled": False}
+        self.agent.config["llm"] = {"history_path": None}
+        self.names = list(self.agent.tool_instances)
+        self.processed = []
+        self.failing = {self.names[0]}
+
+        def fake_process(name, days_back):
+            if name in self.failing:
+                raise RuntimeError("502 bad gateway")
+            self.processed.append(name)
+            items = _items(1)
+            instance = self.agent.tool_instances[name]
+            return {
+                "name": name,
+                "description": "",
+                "summary": f"- {name}",
+                "items": items,
+                "banner_url": None,
+                "source_url": "",
+                "formatted_res": instance.format_output(items),
+            }
+
+        self.agent._cached_or_process = fake_process
+        self.agent._generate_overview_summary = lambda sources, clusters=None, on_text=None: "overview"
+
+    def test_failure_still_checkpoints_other_sources(self):
+        checkpointed = []
+        with self.assertRaises(RuntimeError):
+            self.agent.pulse_search(on_source=checkpointed.append)
+        self.assertEqual(sorted(s["name"] for s in checkpointed), sorted(self.names[1:]))
+
+    def test_failed_run_still_records_usage(self):
+        def summarized(name, days_back):
+            self.agent.ledger.record(LLMCall(stage="summary", model="m", source=name, prompt_tokens=10))
+            return fake_process(name, days_back)
+
+        fake_process = self.agent._cached_or_process
+        self.agent._cached_or_process = summarized
+        reported = []
+        with tempfile.TemporaryDirectory() as tmp:
+            history = os.path.join(tmp, "history.jsonl")
+            self.agent.config["llm"] = {"history_path": history}
+            with self.assertRaises(RuntimeError):
+                self.agent.pulse_search(on_usage=reported.append)
+            with open(history, encoding="utf-8") as f:
+                records = [json.loads(line) for line in f]
+
+        self.assertEqual(len(reported), 1)
+        self.assertTrue(reported[0]["partial"])
+        self.assertEqual(reported[0]["total"]["prompt_tokens"], 10 * len(self.names))
+        self.assertEqual(len(records), 1)
+        self.assertTrue(records[0]["partial"])
+        self.assertEqual(len(records[0]["calls"]), len(self.names))
+
+    def test_completed_sources_are_not_rerun(self):
+        checkpointed = []
+        with self.assertRaises(RuntimeError):
+            self.agent.pulse_search(on_source=checkpointed.append)
+        self.failing.clear()
+        self.processed.clear()
+
+        _, data = self.agent.pulse_search(
+            return_data=True, completed={s["name"]: s for s in checkpointed}
+        )
+        self.assertEqual(self.processed, [self.names[0]])
+        self.assertEqual([s["name"] for s in data["sources"]], self.names)
+        self.assertEqual(data["overall_summary"], "overview")
+
+
+_STREAM_CHUNKS = ["Sure. <RESP", "ONSE>\n## AI Research ", "Roundup\n- item one", "\n- item two</RESP", "ONSE>"]
+
+
+def _sse(event, data):
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n".encode("utf-8")
+
+
+class _StubAnthropicHandler(BaseHTTPRequestHandler):
+    """Minimal /v1/messages endpoint that streams a completion in delayed SSE chunks."""
+
+    protocol_version = "HTTP/1.0"
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.end_headers()
+        events = [_sse("message_start", {
+            "type": "message_start",
+            "message": {
+                "id": "msg_stub", "type": "message", "role": "assistant", "model": "stub-model",
+                "content": [], "stop_reason": None, "stop_sequence": None,
+                "usage": {"input_tokens": 42, "output_tokens": 1},
+            },
+        }), _sse("content_block_start", {
+            "type": "content_block_start", "index": 0, "content_block": {"type": "text", "text": ""},
+        })]
+        events += [
+            _sse("content_block_delta", {
+                "type": "content_block_delta", "index": 0, "delta": {"type": "text_delta", "text": text},
+            })
+            for text in _STREAM_CHUNKS
+        ]
+        events += [
+            _sse("content_block_stop", {"type": "content_block_stop", "index": 0}),
+            _sse("message_delta", {
+                "type": "message_delta",
+                "delta": {"stop_reason": "end_turn", "stop_sequence": None},
+                "usage": {"input_tokens": 42, "output_tokens": 17},
+            }),
+            _sse("message_stop", {"type": "message_stop"}),
+        ]
+        for event in events:
+            self.wfile.write(event)
+            self.wfile.flush()
+            time.sleep(0.02)
+
+    def log_message(self, *args):
+        pass
+
+
+class TestStreamingOverview(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), _StubAnthropicHandler)
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        self.agent = ResearcherAgent()
+        self.agent.llm = ChatAnthropic(
+            model="stub-model",
+            api_key="test-key",
+            base_url=f"http://127.0.0.1:{self.server.server_address[1]}",
+            max_retries=0,
+        )
+
+    def test_overview_text_is_forwarded_incrementally(self):
+        received = []
+        overview = self.agent._generate_overview_summary(
+            [{"name": "arxiv", "summary": "- a paper"}], on_text=lambda delta: received.append((time.perf_counter(), delta))
+        )
+        self.assertGreater(len(received), 1)
+        self.assertEqual("".join(d for _, d in received), "## AI Research Roundup\n- item one\n- item two")
+        self.assertEqual(self.agent._parse_output(overview), "## AI Research Roundup\n- item one\n- item two")
+
+        call = self.agent.ledger.calls()[0]
+        self.assertEqual((call.stage, call.prompt_tokens, call.completion_tokens), ("overview", 42, 17))
+        self.assertIsNotNone(call.first_token_s)
+        self.assertLess(call.first_token_s, call.latency_s)
+
+
+class TestRankingBeforeMaxResults(unittest.TestCase):
+    def test_relevant_item_past_max_results_is_kept(self):
+        agent = ResearcherAgent()
+        agent.config["ranking"] = {"enabled": True, "topics": ["diffusion models"], "per_source_top_k": 6}
+        tool = WebScraperTool("blog", {"type": "html", "base_url": "https://example.com/?q=", "max_results": 2})
+        tool.limit_results = False
+        filler = [
+            {"title": f"Company picnic {i}", "summary": "Photos from the office.", "link": f"/{i}", "date_text": None}
+            for i in range(5)
+        ]
+        relevant = {"title": "New diffusion models paper", "summary": "Diffusion models scale.", "link": "/d", "date_text": None}
+        tool._parse_html_articles = lambda url: filler + [relevant]
+        agent.tool_instances = {"blog": tool}
+
+        ranked = agent._rank_items({"blog": tool.get_recent(days_back=1)}, use_global=False)["blog"]
+        self.assertEqual(len(ranked), 2)
+        self.assertEqual(ranked[0].title, "New diffusion models paper")
+
+
+class TestWarmResults(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.agent = ResearcherAgent()
+        self.agent.result_store = ResultStore(self.tmp.name)
+        self.name = next(iter(self.agent.tool_instances))
+        self.processed = []
+        self.agent.process_source = lambda name, days_back=None, items=None: self.processed.append(name) or {"name": name}
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _store(self, fingerprint, age=0):
+        self.agent.result_store.put(self.name, {
+            "name": self.name, "summary": "warm", "items": [],
+            "fingerprint": fingerprint, "fetched_at": time.time() - age,
+        })
+
+    def test_matching_fingerprint_reuses_stored_result(self):
+        self._store(self.agent._source_fingerprint(self.name, 3))
+        self.assertEqual(self.agent._cached_or_process(self.name, 3)["summary"], "warm")
+        self.assertEqual(self.processed, [])
+
+    def test_mismatched_fingerprint_is_reprocessed(self):
+        self._store(self.agent._source_fingerprint(self.name, 7))
+        self.agent._cached_or_process(self.name, 3)
+        self.assertEqual(self.processed, [self.name])
+
+    def test_expired_result_is_reprocessed(self):
+        self.agent.config.setdefault("scheduler", {})["max_age_factor"] = 1
+        self._store(self.agent._source_fingerprint(self.name, 3), age=self.agent.refresh_interval(self.name) + 5)
+        self.agent._cached_or_process(self.name, 3)
+        self.assertEqual(self.processed, [self.name])
+
+
+class _RecordingLLM:
+    model = "test-model"
+
+    def __init__(self):
+        self.prompts = []
+
+    def invoke(self, messages):
+        self.prompts.append(dict(messages))
+        return AIMessage(content="<RESPONSE>ok</RESPONSE>")
+
+
+class TestOverviewPrompt(unittest.TestCase):
+    def setUp(self):
+        self.agent = ResearcherAgent()
+        self.agent.config["llm"] = {"history_path": None}
+        self.agent.llm = _RecordingLLM()
+        self.summaries = [{"name": "arxiv", "summary": "- a paper"}]
+
+    def test_clustered_prompt_asks_for_one_line_per_story(self):
+        clusters = [{"title": "Agents", "summary": "s", "sources": ["arxiv", "openai"], "items": [{}, {}]}]
+        self.agent._generate_overview_summary(self.summaries, clusters)
+        prompt = self.agent.llm.prompts[0]
+        self.assertIn("For each story, give ONE line", prompt["system"])
+        self.assertNotIn("For each source", prompt["system"])
+        self.assertIn("[arxiv, openai]", prompt["user"])
+
+    def test_unclustered_prompt_keeps_per_source_lines(self):
+        self.agent._generate_overview_summary(self.summaries)
+        self.assertIn("For each source, give ONE line", self.agent.llm.prompts[0]["system"])
+
+
+if __name__ == "__main__":
+    unittest.main()
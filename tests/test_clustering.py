@@ -0,0 +1,35 @@
+import unittest
+
+from src.clustering import cluster_items, format_clusters
+
+
+class TestClustering(unittest.TestCase):
+    def test_groups_same_story_across_sources(self):
+        sources = [
+            {"name": "openai", "items": [
+                {"title": "GPT launch adds agentic coding model", "summary": "New agentic coding model launch", "link": "http://a"},
+            ]},
+            {"name": "arxiv", "items": [
+                {"title": "Agentic coding model launch announced", "summary": "GPT agentic coding model", "link": "http://b"},
+                {"title": "Protein folding with diffusion", "summary": "Biology results", "link": "http://c"},
+            ]},
+        ]
+        clusters = cluster_items(sources, threshold=0.3)
+
+        self.assertEqual(len(clusters), 2)
+        self.assertEqual(set(clusters[0]["sources"]), {"openai", "arxiv"})
+        self.assertEqual(len(clusters[0]["items"]), 2)
+        self.assertEqual(clusters[1]["sources"], ["arxiv"])
+
+        prompt = format_clusters(clusters)
+        self.assertEqual(len(prompt.splitlines()), 2)
+        self.assertIn("(+1 related)", prompt)
+
+    def test_max_clusters_and_empty(self):
+        self.assertEqual(cluster_items([]), [])
+        sources = [{"name": "s", "items": [{"title": f"unrelated topic {w}"} for w in ("alpha", "beta", "gamma")]}]
+        self.assertEqual(len(cluster_items(sources, threshold=0.99, max_clusters=2)), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
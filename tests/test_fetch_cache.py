@@ -0,0 +1,40 @@
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from src.tools.fetch_cache import FetchCache
+
+
+class TestFetchCache(unittest.TestCase):
+    def test_concurrent_callers_share_one_fetch(self):
+        cache = FetchCache()
+        calls = []
+        lock = threading.Lock()
+
+        def fetch():
+            with lock:
+                calls.append(1)
+            time.sleep(0.05)
+            return ["entry"]
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(executor.map(lambda _: cache.get_or_fetch(("rss", "u"), fetch), range(4)))
+
+        self.assertEqual(len(calls), 1)
+        self.assertTrue(all(r == ["entry"] for r in results))
+        self.assertEqual((cache.misses, cache.hits), (1, 3))
+
+    def test_failures_are_not_cached(self):
+        cache = FetchCache()
+
+        def boom():
+            raise RuntimeError("feed down")
+
+        with self.assertRaises(RuntimeError):
+            cache.get_or_fetch("k", boom)
+        self.assertEqual(cache.get_or_fetch("k", lambda: "ok"), "ok")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -59,6 +59,25 @@ class TestHTMLFormatter(unittest.TestCase):
         self.assertIn("card-banner", html)
         self.assertIn("assets/banners/source1.jpg", html)
 
+    def test_format_pulse_renders_clusters(self):
+        clusters = [
+            {
+                "title": "Shared Story",
+                "sources": ["openai", "arxiv"],
+                "items": [
+                    {"source": "openai", "title": "Shared Story", "link": "http://a"},
+                    {"source": "arxiv", "title": "Related Paper", "link": "http://b"},
+                ],
+            }
+        ]
+        html = self.formatter.format_pulse("Overview", [], clusters)
+
+        self.assertIn("Top Stories", html)
+        self.assertIn("Shared Story", html)
+        self.assertIn("Related Paper", html)
+        self.assertIn("story-tag", html)
+        self.assertNotIn("Top Stories", self.formatter.format_pulse("Overview", []))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,53 @@
+import unittest
+from datetime import datetime, timedelta, timezone
+
+from src.tools.dates import parse_date
+from src.tools.item import ResearchItem, canonical_url
+
+
+class TestParseDate(unittest.TestCase):
+    def test_fast_and_fallback_formats(self):
+        self.assertEqual(parse_date("2024-01-05").date().isoformat(), "2024-01-05")
+        self.assertEqual(parse_date("2024-01-05T10:00:00Z").hour, 10)
+        self.assertEqual(parse_date("Mon, 06 Jan 2025 10:00:00 GMT").day, 6)
+        self.assertEqual(parse_date("Dec 5, 2025").month, 12)
+        self.assertEqual(parse_date("2024-01-05").tzinfo, timezone.utc)
+
+    def test_partial_dates_do_not_depend_on_today(self):
+        self.assertEqual(parse_date("June 2025").date().isoformat(), "2025-06-01")
+        self.assertEqual(parse_date("June 5").year, datetime.now(timezone.utc).year)
+
+    def test_relative_dates(self):
+        now = datetime.now(timezone.utc)
+        self.assertEqual(parse_date("3 days ago").date(), (now - timedelta(days=3)).date())
+        self.assertEqual(parse_date("yesterday").date(), (now - timedelta(days=1)).date())
+        self.assertLess(now - parse_date("5 hours ago"), timedelta(hours=5, minutes=1))
+        item = ResearchItem("t", "s", "http://e", published=parse_date("2 weeks ago"))
+        self.assertEqual(item.date, (now - timedelta(weeks=2)).date().isoformat())
+
+    def test_unparseable(self):
+        self.assertIsNone(parse_date(None))
+        self.assertIsNone(parse_date("  "))
+        self.assertIsNone(parse_date("not a date"))
+
+
+class TestResearchItem(unittest.TestCase):
+    def test_canonical_url_and_hash(self):
+        a = ResearchItem("Title", "s", "HTTPS://Example.com/post/?utm_source=x&id=2#top")
+        b = ResearchItem("Title", "other summary", "https://example.com/post?id=2")
+        self.assertEqual(a.url, "https://example.com/post?id=2")
+        self.assertEqual(a.content_hash, b.content_hash)
+        self.assertEqual(canonical_url("#"), "#")
+
+    def test_dict_roundtrip_and_legacy_date(self):
+        item = ResearchItem.from_dict({"title": "T", "summary": "S", "link": "http://x", "date": "2024-01-01"}, "arxiv")
+        self.assertEqual((item.source, item.date), ("arxiv", "2024-01-01"))
+        item.score = 0.5
+        again = ResearchItem.from_dict(item.to_dict(), "arxiv")
+        self.assertEqual((again.published, again.score), (item.published, 0.5))
+        self.assertIs(ResearchItem.coerce(item), item)
+        self.assertEqual(ResearchItem.from_dict({}).date, "Unknown date")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,38 @@
+import os
+import unittest
+
+os.environ.setdefault("FOUNDRY_DEPLOYMENT", "test-model")
+os.environ.setdefault("FOUNDRY_API_KEY", "test-key")
+os.environ.setdefault("FOUNDRY_ENDPOINT", "http://127.0.0.1:9")
+
+from fastmcp import Client
+
+import src.main as server
+
+
+class TestPulseResearchStreaming(unittest.IsolatedAsyncioTestCase):
+    async def test_progress_carries_accumulated_overview(self):
+        def fake_pulse_search(on_overview_text=None, **kwargs):
+            for delta in ["## Round", "up\n", "- item"]:
+                on_overview_text(delta)
+            return "full report"
+
+        original = server.agent.pulse_search
+        server.agent.pulse_search = fake_pulse_search
+        self.addCleanup(setattr, server.agent, "pulse_search", original)
+
+        received = []
+
+        async def on_progress(progress, total, message):
+            received.append((progress, message))
+
+        async with Client(server.app) as client:
+            result = await client.call_tool("pulse_research", {}, progress_handler=on_progress)
+
+        self.assertEqual(result.data, "full report")
+        self.assertEqual([message for _, message in received], ["## Round", "## Roundup\n", "## Roundup\n- item"])
+        self.assertEqual([progress for progress, _ in received], [8, 11, 17])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,89 @@
+from contextlib import redirect_stderr
+import io
+import tempfile
+import threading
+import time
+import tracemalloc
+import unittest
+from pathlib import Path
+
+from src.profiling import SamplingProfiler, library_bucket, profiled
+
+
+def _busy_worker(stop):
+    data = []
+    while not stop.is_set():
+        data.append("x" * 1000)
+        sum(range(2000))
+    return data
+
+
+class TestSamplingProfiler(unittest.TestCase):
+    def test_samples_worker_threads_into_folded_stacks(self):
+        stop = threading.Event()
+        worker = threading.Thread(target=_busy_worker, args=(stop,), name="worker-1")
+        with SamplingProfiler(interval_seconds=0.002) as profiler:
+            worker.start()
+            time.sleep(0.2)
+            stop.set()
+            worker.join()
+
+        self.assertGreater(profiler.samples, 0)
+        lines = list(profiler.folded())
+        worker_lines = [line for line in lines if line.startswith("worker-1;")]
+        self.assertTrue(any("_busy_worker" in line for line in worker_lines))
+        stack, count = worker_lines[0].rsplit(" ", 1)
+        self.assertGreater(int(count), 0)
+        self.assertNotIn(" ", stack)
+
+    def test_library_bucket_uses_innermost_known_module(self):
+        self.assertEqual(library_bucket(["re", "bs4.builder", "src.tools.webscraper_tool"]), "BeautifulSoup")
+        self.assertEqual(library_bucket(["ssl", "urllib3.connection", "requests.api"]), "network")
+        self.assertEqual(library_bucket(["src.agent"]), "other")
+
+    def test_profiled_writes_reports_even_on_error(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            with self.assertRaises(RuntimeError):
+                with profiled(tmp, {"interval_ms": 2, "top_allocations": 5}):
+                    _ = [bytearray(10_000) for _ in range(50)]
+                    time.sleep(0.05)
+                    raise RuntimeError("boom")
+            for name in ("profile.folded", "profile_summary.txt", "allocations.txt"):
+                self.assertTrue((Path(tmp) / name).exists(), name)
+            self.assertIn("allocation sites", (Path(tmp) / "allocations.txt").read_text())
+
+    def test_overlapping_profiled_blocks_share_tracemalloc(self):
+        # The first block to finish must not stop tracemalloc under the second.
+        first_done = threading.Event()
+        results = {}
+
+        def slow(tmp):
+            with profiled(tmp, {"interval_ms": 2}):
+                first_done.wait(5)
+                results["slow"] = "ok"
+
+        with tempfile.TemporaryDirectory() as tmp:
+            thread = threading.Thread(target=slow, args=(Path(tmp) / "slow",))
+            thread.start()
+            time.sleep(0.05)
+            with profiled(Path(tmp) / "fast", {"interval_ms": 2}):
+                time.sleep(0.02)
+            first_done.set()
+            thread.join()
+            self.assertEqual(results, {"slow": "ok"})
+            for run in ("fast", "slow"):
+                self.assertIn("allocation sites", (Path(tmp) / run / "allocations.txt").read_text())
+        self.assertFalse(tracemalloc.is_tracing())
+
+    def test_profiled_never_replaces_block_result(self):
+        def run():
+            with profiled("/dev/null/not-a-dir", {"interval_ms": 2, "trace_allocations": False}):
+                return "result"
+
+        with redirect_stderr(io.StringIO()) as err:
+            self.assertEqual(run(), "result")
+        self.assertIn("Profiling failed", err.getvalue())
+
+
+if __name__ == "__main__":
+    unittest.main()
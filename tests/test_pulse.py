@@ -0,0 +1,109 @@
+import os
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from unittest import mock
+
+os.environ.setdefault("FOUNDRY_DEPLOYMENT", "test-model")
+os.environ.setdefault("FOUNDRY_API_KEY", "test-key")
+os.environ.setdefault("FOUNDRY_ENDPOINT", "http://127.0.0.1:9")
+
+import feedparser
+import yaml
+
+from src import pulse
+from src.agent import ResearcherAgent
+from src.report_store import ReportReader, ReportWriter
+
+FEED_URL = "https://example.com/feed.xml"
+
+
+def _feed():
+    now = time.gmtime()
+    entries = [
+        feedparser.FeedParserDict(title=title, summary=summary, link=link, published_parsed=now)
+        for title, summary, link in [
+            ("Diffusion model release", "A faster diffusion sampler.", "https://example.com/1"),
+            ("Robotics benchmark", "New robotics manipulation suite.", "https://example.com/2"),
+        ]
+    ]
+    return feedparser.FeedParserDict(entries=entries)
+
+
+class TestBatchProfiles(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        root = Path(self.tmp.name)
+        self.configs = []
+        for profile, topic in (("vision", "diffusion"), ("robots", "robotics")):
+            path = root / f"{profile}.yaml"
+            path.write_text(yaml.safe_dump({
+                "days_back": 1,
+                "llm": {"history_path": None},
+                "scraping": {"render_modes_path": str(root / "render_modes.json")},
+                "tools": {"webscrapers": {"shared feed": {"type": "rss", "url": FEED_URL, "topics": [topic]}}},
+            }))
+            self.configs.append(str(path))
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_overlapping_source_is_parsed_once_and_filtered_per_profile(self):
+        output_root = Path(self.tmp.name) / "output"
+        llm_reply = "<RESPONSE>- summary</RESPONSE>"
+        with mock.patch.object(pulse, "OUTPUT_ROOT", output_root), \
+                mock.patch("src.tools.webscraper_tool.feedparser.parse", return_value=_feed()) as parse, \
+                mock.patch("src.agent.ResearcherAgent._invoke_llm", return_value=llm_reply):
+            pulse.write_batch_from_live(self.configs)
+
+        parse.assert_called_once_with(FEED_URL)
+        batch_dir = next(output_root.glob("batch_at_*"))
+        titles = {}
+        for profile in ("vision", "robots"):
+            source = ReportReader(next((batch_dir / profile).glob("report.jsonl*"))).source("shared feed")
+            titles[profile] = [item.title for item in source["items"]]
+        self.assertEqual(titles, {"vision": ["Diffusion model release"], "robots": ["Robotics benchmark"]})
+
+
+class TestResume(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp.name)
+        self.config = self.root / "config.yaml"
+        self.config.write_text(yaml.safe_dump({
+            "days_back": 1,
+            "llm": {"history_path": None},
+            "scraping": {"render_modes_path": str(self.root / "render_modes.json")},
+            "tools": {"webscrapers": {
+                "first": {"type": "rss", "url": "https://example.com/first.xml"},
+                "second": {"type": "rss", "url": "https://example.com/second.xml"},
+            }},
+        }))
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_resume_appends_without_rewriting_checkpoints(self):
+        output_dir = self.root / "run"
+        output_dir.mkdir()
+        report_path = output_dir / "report.jsonl"
+        with ReportWriter(report_path, generated_at="2024-01-01T00:00:00", days_back=1) as writer:
+            writer.write_source({"name": "first", "summary": "- checkpointed", "items": []})
+        checkpoint = report_path.read_bytes()
+        completed = list(ReportReader(report_path).sources())
+
+        llm_reply = "<RESPONSE>- summary</RESPONSE>"
+        with mock.patch("src.tools.webscraper_tool.feedparser.parse", return_value=_feed()) as parse, \
+                mock.patch("src.agent.ResearcherAgent._invoke_llm", return_value=llm_reply):
+            agent = ResearcherAgent(str(self.config))
+            pulse._generate_live_report(agent, output_dir, completed=completed, generated_at="2024-01-01T00:00:00")
+
+        parse.assert_called_once_with("https://example.com/second.xml")
+        self.assertTrue(report_path.read_bytes().startswith(checkpoint))
+        summaries = {s["name"]: s["summary"] for s in ReportReader(report_path).load()["sources"]}
+        self.assertEqual(summaries, {"first": "- checkpointed", "second": "- summary"})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,47 @@
+import unittest
+
+from src.ranking import rank_sources, score_items
+from src.tools.item import ResearchItem
+
+
+def _item(title, summary=""):
+    return ResearchItem(title=title, summary=summary, link="#")
+
+
+class TestRanking(unittest.TestCase):
+    def test_relevant_items_score_higher(self):
+        items = [
+            _item("Quarterly earnings call recap", "Revenue grew in retail."),
+            _item("Scaling deep learning with neural networks", "New training recipe for deep learning."),
+        ]
+        scores = score_items(items, ["deep learning", "neural networks"])
+        self.assertGreater(scores[1], scores[0])
+
+    def test_rank_sources_applies_per_source_and_global_top_k(self):
+        items_by_source = {
+            "a": [_item("deep learning news"), _item("cooking tips"), _item("neural networks deep learning")],
+            "b": [_item("gardening"), _item("deep learning benchmark")],
+        }
+        ranked = rank_sources(items_by_source, ["deep learning", "neural networks"], per_source_top_k=2, global_top_k=3)
+
+        self.assertEqual(len(ranked["a"]), 2)
+        self.assertEqual(ranked["a"][0].title, "neural networks deep learning")
+        self.assertEqual(sum(len(v) for v in ranked.values()), 3)
+        self.assertNotIn("gardening", [i.title for i in ranked["b"]])
+        for items in ranked.values():
+            for item in items:
+                self.assertIsInstance(item.score, float)
+
+    def test_no_topics_keeps_order(self):
+        items = {"a": [_item("first"), _item("second")]}
+        ranked = rank_sources(items, [], per_source_top_k=1)
+        self.assertEqual([i.title for i in ranked["a"]], ["first"])
+
+    def test_per_source_limits_can_differ(self):
+        items = {"a": [_item("x"), _item("y"), _item("z")], "b": [_item("x"), _item("y")]}
+        ranked = rank_sources(items, ["x"], per_source_top_k={"a": 1, "b": None})
+        self.assertEqual((len(ranked["a"]), len(ranked["b"])), (1, 2))
+
+
+if __name__ == "__main__":
+    unittest.main()
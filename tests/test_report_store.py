@@ -0,0 +1,93 @@
+import json
+import os
+import tempfile
+import unittest
+from pathlib import Path
+
+from src.report_store import ReportReader, ReportWriter, load_report, render_markdown, report_filename
+
+
+class TestReportStore(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.dir = Path(self.tmp.name)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _write(self, compression: str) -> Path:
+        path = self.dir / report_filename(compression)
+        with ReportWriter(path, generated_at="2024-01-01T00:00:00", days_back=5) as writer:
+            writer.write_source({
+                "name": "beta",
+                "summary": "- beta bullet",
+                "items": [{"title": "Beta Post", "summary": "b", "link": "http://b", "date": "2024-01-01"}],
+                "banner_url": None,
+            })
+            writer.write_source({"name": "alpha", "summary": "- alpha bullet", "items": []})
+            writer.write_overview("Overview text", ["alpha", "beta"])
+        return path
+
+    def test_roundtrip_orders_sources_and_drops_empty_fields(self):
+        for compression in ("none", "gzip"):
+            path = self._write(compression)
+            data = ReportReader(path).load()
+            self.assertEqual(data["overall_summary"], "Overview text")
+            self.assertEqual(data["days_back"], 5)
+            self.assertEqual([s["name"] for s in data["sources"]], ["alpha", "beta"])
+            self.assertNotIn("banner_url", data["sources"][1])
+
+    def test_lazy_reads(self):
+        reader = ReportReader(self._write("gzip"))
+        self.assertEqual(reader.overview(), "Overview text")
+        beta_post = reader.source("beta")["items"][0]
+        self.assertEqual(beta_post.title, "Beta Post")
+        self.assertEqual(beta_post.date, "2024-01-01")
+        self.assertIsNone(reader.source("missing"))
+        self.assertEqual(reader.header()["version"], 2)
+
+    def test_partial_report_is_readable(self):
+        path = self.dir / report_filename("none")
+        writer = ReportWriter(path, days_back=1)
+        writer.write_source({"name": "alpha", "summary": "s", "items": []})
+        with open(path, "a", encoding="utf-8") as fh:
+            fh.write('{"type":"source","name":"trunc')
+        data = ReportReader(path).load()
+        writer.close()
+        self.assertEqual([s["name"] for s in data["sources"]], ["alpha"])
+        self.assertEqual(data["overall_summary"], "")
+
+    def test_append_resumes_after_interrupted_run(self):
+        for compression in ("none", "gzip"):
+            path = self.dir / report_filename(compression)
+            with ReportWriter(path, generated_at="2024-01-01T00:00:00", days_back=1) as writer:
+                writer.write_source({"name": "alpha", "summary": "s", "items": []})
+                writer.write_source({"name": "cut", "summary": os.urandom(200).hex(), "items": []})
+            # Crash mid-record: the last line (and the gzip trailer) never made it to disk.
+            path.write_bytes(path.read_bytes()[:-20])
+
+            with ReportWriter(path, generated_at="ignored", days_back=1, append=True) as writer:
+                writer.write_source({"name": "beta", "summary": "s", "items": []})
+                writer.write_overview("done", ["alpha", "beta"])
+
+            reader = ReportReader(path)
+            self.assertEqual(reader.header()["generated_at"], "2024-01-01T00:00:00")
+            data = reader.load()
+            self.assertEqual([s["name"] for s in data["sources"]], ["alpha", "beta"], compression)
+            self.assertEqual(data["overall_summary"], "done")
+
+    def test_legacy_json_still_loads(self):
+        legacy = {"overall_summary": "old", "sources": [], "combined_markdown": "# Pulse Summary\nold"}
+        path = self.dir / "report.json"
+        path.write_text(json.dumps(legacy, indent=2), encoding="utf-8")
+        self.assertEqual(load_report(path)["combined_markdown"], legacy["combined_markdown"])
+
+    def test_render_markdown_rebuilds_sections(self):
+        md = render_markdown("Overview", [{"name": "arxiv", "summary": "- point", "items": []}])
+        self.assertTrue(md.startswith("# Pulse Summary\nOverview"))
+        self.assertIn("## arxiv\n- point", md)
+        self.assertIn("No recent results from arxiv.", md)
+
+
+if __name__ == "__main__":
+    unittest.main()
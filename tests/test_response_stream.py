@@ -0,0 +1,37 @@
+import unittest
+
+from src.response_stream import ResponseStreamParser
+
+
+def _feed_all(chunks):
+    parser = ResponseStreamParser()
+    deltas = [parser.feed(chunk) for chunk in chunks]
+    return parser, [d for d in deltas if d]
+
+
+class TestResponseStreamParser(unittest.TestCase):
+    def test_tags_split_across_chunks(self):
+        parser, deltas = _feed_all(["thinking... <RESP", "ONSE>\n  ## Round", "up\nmore</RES", "PONSE> trailing"])
+        self.assertEqual("".join(deltas), "## Roundup\nmore")
+        self.assertEqual(parser.text, "## Roundup\nmore")
+        self.assertTrue(parser.done)
+
+    def test_text_is_forwarded_before_closing_tag(self):
+        parser = ResponseStreamParser()
+        self.assertEqual(parser.feed("<RESPONSE>Hello "), "Hello ")
+        self.assertEqual(parser.feed("world <"), "world ")
+        self.assertEqual(parser.feed("b>"), "<b>")
+        self.assertFalse(parser.done)
+
+    def test_no_output_without_opening_tag(self):
+        parser, deltas = _feed_all(["no tags ", "here </RESPONSE>"])
+        self.assertEqual(deltas, [])
+        self.assertFalse(parser.started)
+
+    def test_single_chunk(self):
+        parser, deltas = _feed_all(["<RESPONSE>ok</RESPONSE>"])
+        self.assertEqual(deltas, ["ok"])
+
+
+if __name__ == "__main__":
+    unittest.main()
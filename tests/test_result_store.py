@@ -0,0 +1,43 @@
+import os
+import tempfile
+import time
+import unittest
+
+from src.result_store import ResultStore
+
+
+class TestResultStore(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.store = ResultStore(self.tmp.name)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_put_and_reload_from_disk(self):
+        self.store.put("google ai", {"name": "google ai", "summary": "s", "items": []})
+        reloaded = ResultStore(self.tmp.name).get("google ai")
+        self.assertEqual(reloaded["summary"], "s")
+        self.assertIn("fetched_at", reloaded)
+
+    def test_get_fresh_respects_max_age(self):
+        self.store.put("arxiv", {"name": "arxiv", "fetched_at": time.time() - 120})
+        self.assertIsNone(self.store.get_fresh("arxiv", max_age_seconds=60))
+        self.assertIsNotNone(self.store.get_fresh("arxiv", max_age_seconds=600))
+        self.assertIsNone(self.store.get_fresh("missing", max_age_seconds=600))
+
+    def test_sees_refreshes_written_by_another_process(self):
+        self.store.put("arxiv", {"name": "arxiv", "summary": "old", "fetched_at": time.time() - 120})
+        self.assertEqual(self.store.get("arxiv")["summary"], "old")
+
+        # A scheduler daemon with its own store refreshes the source.
+        ResultStore(self.tmp.name).put("arxiv", {"name": "arxiv", "summary": "new"})
+        path = self.store._path("arxiv")
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        self.assertEqual(self.store.get("arxiv")["summary"], "new")
+        self.assertIsNotNone(self.store.get_fresh("arxiv", max_age_seconds=60))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,109 @@
+import contextlib
+import io
+import tempfile
+import time
+import unittest
+from unittest import mock
+
+from src.result_store import ResultStore
+from src.scheduler import PulseScheduler
+
+
+class _StubAgent:
+    def __init__(self, store, intervals):
+        self.config = {"scheduler": {"retry_seconds": 30}, "parallelism": {"max_workers": 2}}
+        self.result_store = store
+        self.tool_instances = {name: object() for name in intervals}
+        self.intervals = intervals
+        self.failing = set()
+        self.processed = []
+
+    def refresh_interval(self, name):
+        return self.intervals[name]
+
+    def process_source(self, name, days_back=None):
+        if name in self.failing:
+            raise RuntimeError("feed down")
+        self.processed.append(name)
+        result = {"name": name, "summary": "s", "items": []}
+        self.result_store.put(name, result)
+        return result
+
+
+def _delays(scheduler, now):
+    return {name: due - now for due, name in scheduler._queue}
+
+
+class TestPulseScheduler(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.store = ResultStore(self.tmp.name)
+        self.agent = _StubAgent(self.store, {"cold": 600.0, "warm": 600.0, "stale": 60.0})
+        self.scheduler = PulseScheduler(self.agent, jitter_seconds=0)
+        self.stderr = io.StringIO()
+        self._redirect = contextlib.redirect_stderr(self.stderr)
+        self._redirect.__enter__()
+
+    def tearDown(self):
+        self._redirect.__exit__(None, None, None)
+        self.scheduler.stop()
+        self.tmp.cleanup()
+
+    def test_initial_queue_runs_stale_sources_now_and_warm_ones_on_expiry(self):
+        self.store.put("warm", {"name": "warm", "items": [], "fetched_at": time.time() - 100})
+        self.store.put("stale", {"name": "stale", "items": [], "fetched_at": time.time() - 120})
+        now = time.time()
+        self.scheduler._initial_queue()
+        delays = _delays(self.scheduler, now)
+
+        self.assertAlmostEqual(delays["cold"], 0, delta=1)
+        self.assertAlmostEqual(delays["stale"], 0, delta=1)
+        self.assertAlmostEqual(delays["warm"], 500, delta=1)
+        self.assertIn(self.scheduler._queue[0][1], ("cold", "stale"))
+
+    def test_jitter_is_added_to_every_due_time(self):
+        scheduler = PulseScheduler(self.agent, jitter_seconds=45)
+        with mock.patch("src.scheduler.random.uniform", return_value=45) as uniform:
+            now = time.time()
+            scheduler._initial_queue()
+        uniform.assert_called_with(0, 45)
+        for delay in _delays(scheduler, now).values():
+            self.assertGreaterEqual(delay, 45)
+        scheduler.stop()
+
+    def test_successful_refresh_is_rescheduled_after_its_interval(self):
+        self.scheduler._in_flight.add("cold")
+        now = time.time()
+        stdout = io.StringIO()
+        with contextlib.redirect_stdout(stdout):
+            self.scheduler._refresh("cold")
+
+        self.assertEqual(self.agent.processed, ["cold"])
+        self.assertNotIn("cold", self.scheduler._in_flight)
+        self.assertAlmostEqual(_delays(self.scheduler, now)["cold"], 600, delta=1)
+        self.assertIsNotNone(self.store.get("cold"))
+        self.assertIn("[scheduler] refreshed cold", self.stderr.getvalue())
+        self.assertEqual(stdout.getvalue(), "")
+
+    def test_failed_refresh_retries_after_retry_seconds(self):
+        self.agent.failing.add("cold")
+        now = time.time()
+        self.scheduler._refresh("cold")
+        self.assertAlmostEqual(_delays(self.scheduler, now)["cold"], 30, delta=1)
+        self.assertIn("refresh of cold failed", self.stderr.getvalue())
+
+    def test_retry_never_waits_longer_than_the_interval(self):
+        self.agent.failing.add("stale")
+        self.scheduler.retry_seconds = 300
+        now = time.time()
+        self.scheduler._refresh("stale")
+        self.assertAlmostEqual(_delays(self.scheduler, now)["stale"], 60, delta=1)
+
+    def test_stopped_scheduler_does_not_reschedule(self):
+        self.scheduler._stop.set()
+        self.scheduler._refresh("cold")
+        self.assertEqual(self.scheduler._queue, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
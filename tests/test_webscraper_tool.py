@@ -0,0 +1,119 @@
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import requests
+
+from src.tools.render_modes import RenderModeStore
+from src.tools.webscraper_tool import WebScraperTool
+
+STATIC_HTML = "<ul><li class='post'><a href='/a'>Static post</a><time>2024-01-01</time></li></ul>"
+SHELL_HTML = "<div id='app'></div>"
+RENDERED_HTML = "<ul><li class='post'><a href='/b'>Rendered post</a></li></ul>"
+
+
+class TestStaticFirstScraping(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.tool = WebScraperTool("blog", {
+            "type": "html",
+            "base_url": "https://example.com/news",
+            "article_selector": "li.post",
+            "title_selector": "a",
+            "link_selector": "a",
+            "date_selector": "time",
+            "use_playwright": True,
+        })
+        self.tool.render_modes = RenderModeStore(Path(self.tmp.name) / "render_modes.json")
+        self.fetches = []
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _stub(self, static_html):
+        self.tool._static_fetch = lambda url, check_status=False: self.fetches.append("static") or static_html
+        self.tool._render_fetch = lambda url: self.fetches.append("render") or RENDERED_HTML
+
+    def test_static_html_skips_browser(self):
+        self._stub(STATIC_HTML)
+        articles = self.tool._parse_html_articles("https://example.com/news")
+        self.assertEqual([a["title"] for a in articles], ["Static post"])
+        self.assertEqual(self.fetches, ["static"])
+        self.assertFalse(self.tool.render_modes.needs_js("blog"))
+
+    def test_js_sources_are_remembered(self):
+        self._stub(SHELL_HTML)
+        articles = self.tool._parse_html_articles("https://example.com/news")
+        self.assertEqual([a["title"] for a in articles], ["Rendered post"])
+        self.assertEqual(self.fetches, ["static", "render"])
+
+        # Persisted: a fresh store (e.g. next run) goes straight to the browser.
+        self.tool.render_modes = RenderModeStore(Path(self.tmp.name) / "render_modes.json")
+        self.fetches.clear()
+        self.tool._parse_html_articles("https://example.com/news")
+        self.assertEqual(self.fetches, ["render"])
+
+    def test_transient_static_failure_is_not_remembered(self):
+        def _fail(url, check_status=False):
+            self.fetches.append("static")
+            raise requests.ConnectionError("reset")
+
+        self._stub(STATIC_HTML)
+        self.tool._static_fetch = _fail
+        articles = self.tool._parse_html_articles("https://example.com/news")
+        self.assertEqual([a["title"] for a in articles], ["Rendered post"])
+        self.assertIsNone(self.tool.render_modes.needs_js("blog"))
+
+    def test_error_status_is_not_remembered(self):
+        error_page = requests.Response()
+        error_page.status_code = 503
+        error_page._content = b"<html><body>Service Unavailable</body></html>"
+        error_page.url = "https://example.com/news"
+
+        self.tool._render_fetch = lambda url: self.fetches.append("render") or RENDERED_HTML
+        with mock.patch("src.tools.webscraper_tool.requests.get", return_value=error_page):
+            articles = self.tool._parse_html_articles("https://example.com/news")
+        self.assertEqual([a["title"] for a in articles], ["Rendered post"])
+        self.assertEqual(self.fetches, ["render"])
+        self.assertIsNone(self.tool.render_modes.needs_js("blog"))
+
+
+class TestRenderModeStore(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self.tmp.name) / "render_modes.json"
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_shared_returns_one_store_per_path(self):
+        self.assertIs(RenderModeStore.shared(self.path), RenderModeStore.shared(str(self.path)))
+
+    def test_concurrent_stores_merge_instead_of_overwriting(self):
+        stores = [RenderModeStore(self.path), RenderModeStore(self.path)]
+        errors = []
+
+        def _write(store, prefix):
+            try:
+                for i in range(100):
+                    store.remember(f"{prefix}{i}", i % 2 == 0)
+            except Exception as exc:
+                errors.append(exc)
+
+        threads = [threading.Thread(target=_write, args=(store, f"s{n}-")) for n, store in enumerate(stores)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        self.assertEqual(errors, [])
+        reloaded = RenderModeStore(self.path)
+        self.assertTrue(reloaded.needs_js("s0-98"))
+        self.assertFalse(reloaded.needs_js("s1-99"))
+        self.assertEqual(list(Path(self.tmp.name).glob("*.tmp")), [])
+
+
+if __name__ == "__main__":
+    unittest.main()